@@ -371,12 +371,12 @@ class DigiEnemy(Enemy):
     def enable(self) -> None:
         super().enable()
 
-        for location in Locations:
-            if isinstance(location, Enemy) and location.name == self.fallback:
-                self.fallback_enemy = location
+        from .. import catalog
 
-        if not self.fallback_enemy:
+        fallback_enemy = catalog.find_named(Enemy, self.fallback)
+        if not fallback_enemy:
             raise Exception(f"Failed to find fallback enemy for {self}")
+        self.fallback_enemy = fallback_enemy
 
     @property
     def item(self) -> Optional[ItemPool]:
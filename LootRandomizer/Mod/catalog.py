@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from .defines import *
+
+import hashlib
+
+from typing import Dict, List, Optional, Type, TypeVar, TYPE_CHECKING
+
+if BL2:
+    module_name = "bl2"
+    from .bl2.items import Items
+    from .bl2.locations import Locations
+elif TPS:
+    module_name = "tps"
+    from .tps.items import Items
+    from .tps.locations import Locations
+else:
+    raise
+
+if TYPE_CHECKING:
+    from .items import ItemPool
+    from .locations import Location
+
+
+# These indices are built on first use and live in module globals, so that
+# reloading the game's catalog modules (along with this one) rebuilds them.
+_items_by_name: Optional[Dict[str, ItemPool]] = None
+_locations_by_string: Optional[Dict[str, Location]] = None
+_locations_by_name: Optional[Dict[str, List[Location]]] = None
+_item_indices: Optional[Dict[ItemPool, int]] = None
+_location_indices: Optional[Dict[Location, int]] = None
+_digest: Optional[bytes] = None
+
+
+def _build_indices() -> None:
+    global _items_by_name, _locations_by_string, _locations_by_name
+    global _item_indices, _location_indices, _digest
+
+    _items_by_name = dict()
+    _item_indices = dict()
+    for index, item in enumerate(Items):
+        _items_by_name.setdefault(item.name, item)
+        _item_indices[item] = index
+
+    _locations_by_string = dict()
+    _locations_by_name = dict()
+    _location_indices = dict()
+    for index, location in enumerate(Locations):
+        _locations_by_string.setdefault(str(location), location)
+        _locations_by_name.setdefault(location.name, []).append(location)
+        _location_indices[location] = index
+
+    contents = "\n".join(
+        (*(item.name for item in Items), "", *map(str, Locations))
+    )
+    _digest = hashlib.md5(contents.encode("utf-8")).digest()
+
+
+def find_item(name: str) -> Optional[ItemPool]:
+    if _items_by_name is None:
+        _build_indices()
+    return _items_by_name.get(name)  # type: ignore
+
+
+def find_location(string: str) -> Optional[Location]:
+    if _locations_by_string is None:
+        _build_indices()
+    return _locations_by_string.get(string)  # type: ignore
+
+
+LocationType = TypeVar("LocationType", bound="Location")
+
+
+def find_named(
+    location_type: Type[LocationType], name: str
+) -> Optional[LocationType]:
+    if _locations_by_name is None:
+        _build_indices()
+    for location in _locations_by_name.get(name, ()):  # type: ignore
+        if isinstance(location, location_type):
+            return location
+    return None
+
+
+def item_index(item: ItemPool) -> int:
+    if _item_indices is None:
+        _build_indices()
+    return _item_indices[item]  # type: ignore
+
+
+def location_index(location: Location) -> int:
+    if _location_indices is None:
+        _build_indices()
+    return _location_indices[location]  # type: ignore
+
+
+def digest() -> bytes:
+    """
+    A hash of the names of every item and location in the catalog, in order.
+    Data that refers to the catalog by index is only valid for the catalog
+    whose digest it was written with.
+    """
+    if _digest is None:
+        _build_indices()
+    return _digest  # type: ignore
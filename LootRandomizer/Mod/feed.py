@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from unrealsdk import Log
+
+import http.server, json, queue, threading
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Overlays may follow the applied seed's tracker through a server on localhost,
+# rather than by polling the tracker file. It serves:
+#
+#   /snapshot  The seed's string, and the state of each of its locations.
+#   /events    A stream of server-sent events: a "reset" event with a snapshot
+#              whenever a seed's tracker is loaded, and an "update" event each
+#              time a location is logged.
+#
+# A location's state is "none", "hint" or "item", along with the hint or item
+# logged for it. The server runs on its own threads, and only ever reads the
+# state published to it here, never the game's.
+
+HOST = "127.0.0.1"
+PORT = 8778
+
+# Seconds between comments sent to keep idle event streams open.
+KEEPALIVE_INTERVAL = 15.0
+
+# Events queued for a subscriber that falls this far behind are dropped, and
+# the subscriber is disconnected.
+_SUBSCRIBER_QUEUE_SIZE = 256
+
+LOGGED_NAMES = ("none", "hint", "item")
+
+
+_lock = threading.Lock()
+_seed: Optional[str] = None
+_locations: Dict[str, Tuple[str, str]] = dict()
+_subscribers: List[queue.Queue] = []
+
+_server: Optional[http.server.ThreadingHTTPServer] = None
+
+
+def _snapshot() -> dict:
+    return {
+        "seed": _seed,
+        "locations": [
+            {"location": location, "state": state, "value": value}
+            for location, (state, value) in _locations.items()
+        ],
+    }
+
+
+def _disconnect(subscriber: queue.Queue) -> None:
+    # Discard whatever has yet to be sent, and end the stream.
+    while True:
+        try:
+            subscriber.get_nowait()
+        except queue.Empty:
+            break
+    subscriber.put_nowait(None)
+
+
+def _broadcast(event: str, data: dict) -> None:
+    message = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+    for subscriber in list(_subscribers):
+        try:
+            subscriber.put_nowait(message)
+        except queue.Full:
+            _subscribers.remove(subscriber)
+            _disconnect(subscriber)
+
+
+def running() -> bool:
+    return _server is not None
+
+
+def reset(
+    seed: Optional[str], locations: Iterable[Tuple[str, int, str]]
+) -> None:
+    """
+    Replace the published state with that of the given seed's tracker, given
+    as each location's name, how much of it is logged, and what is logged.
+    """
+    global _seed
+    if not _server:
+        return
+    with _lock:
+        _seed = seed
+        _locations.clear()
+        for location, logged, value in locations:
+            _locations[location] = (LOGGED_NAMES[logged], value)
+        _broadcast("reset", _snapshot())
+
+
+def publish(seed: str, location: str, logged: int, value: str) -> None:
+    """Publish a location of the seed being logged."""
+    if not _server:
+        return
+    with _lock:
+        if seed != _seed:
+            return
+        state = LOGGED_NAMES[logged]
+        _locations[location] = (state, value)
+        _broadcast(
+            "update",
+            {
+                "seed": seed,
+                "location": location,
+                "state": state,
+                "value": value,
+            },
+        )
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _send_headers(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+
+        if path == "/snapshot":
+            with _lock:
+                body = json.dumps(_snapshot()).encode()
+            self._send_headers("application/json")
+            self.wfile.write(body)
+
+        elif path == "/events":
+            self._stream()
+
+        else:
+            self.send_error(404)
+
+    def _stream(self) -> None:
+        subscriber: queue.Queue = queue.Queue(_SUBSCRIBER_QUEUE_SIZE)
+        with _lock:
+            # Late subscribers start off with the current state.
+            subscriber.put_nowait(
+                f"event: reset\ndata: {json.dumps(_snapshot())}\n\n".encode()
+            )
+            _subscribers.append(subscriber)
+
+        self.close_connection = True
+        try:
+            self._send_headers("text/event-stream")
+            while True:
+                try:
+                    message = subscriber.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    message = b": keepalive\n\n"
+                if message is None:
+                    return
+                self.wfile.write(message)
+                self.wfile.flush()
+        except OSError:
+            pass  # The subscriber went away.
+        finally:
+            with _lock:
+                if subscriber in _subscribers:
+                    _subscribers.remove(subscriber)
+
+
+def start(port: int = PORT) -> None:
+    global _server
+    if _server:
+        return
+
+    try:
+        server = http.server.ThreadingHTTPServer((HOST, port), _Handler)
+    except OSError as error:
+        Log(f"Could not start tracker feed on port {port}: {error}")
+        return
+    server.daemon_threads = True
+
+    _server = server
+    threading.Thread(
+        target=server.serve_forever, name="LootRandomizer.feed", daemon=True
+    ).start()
+
+
+def stop() -> None:
+    global _server, _seed
+    if not _server:
+        return
+
+    with _lock:
+        _seed = None
+        _locations.clear()
+        for subscriber in _subscribers:
+            _disconnect(subscriber)
+        _subscribers.clear()
+
+    _server.shutdown()
+    _server.server_close()
+    _server = None
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import difflib, json, os
+
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+# The history of each game's seed versions is stored as one base version, plus
+# a delta per subsequent version listing the entries it deletes from, retags
+# in, and inserts into the version before it. Tags are written by name, with
+# the bit each name stands for recorded once at the top of the file.
+#
+# This module only relies on the standard library, so that seed versions can
+# be rebuilt outside of the game.
+
+Entry = Tuple[str, int]
+
+
+class SeedVersion(NamedTuple):
+    version: int
+    tags: int
+    items: Tuple[Entry, ...]
+    locations: Tuple[Entry, ...]
+
+
+def history_path(game: str) -> str:
+    return os.path.join(os.path.dirname(__file__), game, "versions.json")
+
+
+class History:
+    game: str
+    tag_bits: Dict[str, int]
+
+    _versions: Dict[int, Dict[str, Any]]
+    _cache: Dict[int, SeedVersion]
+
+    def __init__(self, game: str) -> None:
+        self.game = game
+        self._cache = dict()
+
+        path = history_path(game)
+        if not os.path.exists(path):
+            self.tag_bits = dict()
+            self._versions = dict()
+            return
+
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        self.tag_bits = data["tags"]
+        self._versions = {
+            int(version): delta for version, delta in data["versions"].items()
+        }
+
+    @property
+    def versions(self) -> Sequence[int]:
+        return sorted(self._versions)
+
+    def encode_tags(self, tags: int) -> str:
+        return "|".join(
+            name for name, bit in self.tag_bits.items() if bit & tags
+        )
+
+    def decode_tags(self, string: str) -> int:
+        tags = 0
+        for name in string.split("|"):
+            if name:
+                tags |= self.tag_bits[name]
+        return tags
+
+    def _decode_entries(self, entries: Sequence[List[Any]]) -> List[Entry]:
+        return [(name, self.decode_tags(tags)) for name, tags in entries]
+
+    def _apply_delta(
+        self, entries: Sequence[Entry], delta: Dict[str, Any]
+    ) -> Tuple[Entry, ...]:
+        deleted = set(delta.get("delete", ()))
+        retagged = {
+            name: self.decode_tags(tags)
+            for name, tags in delta.get("retag", ())
+        }
+
+        rebuilt = [
+            (name, retagged.get(name, tags))
+            for name, tags in entries
+            if name not in deleted
+        ]
+        for position, name, tags in delta.get("insert", ()):
+            rebuilt.insert(position, (name, self.decode_tags(tags)))
+
+        return tuple(rebuilt)
+
+    def load(self, version: int) -> SeedVersion:
+        seed_version = self._cache.get(version)
+        if seed_version:
+            return seed_version
+
+        delta = self._versions.get(version)
+        if delta is None:
+            raise ValueError(
+                f"No seed version {version} in {self.game} history"
+            )
+
+        if "base" in delta:
+            base = delta["base"]
+            items = tuple(self._decode_entries(base["items"]))
+            locations = tuple(self._decode_entries(base["locations"]))
+        else:
+            previous = self.load(max(v for v in self._versions if v < version))
+            items = self._apply_delta(previous.items, delta["items"])
+            locations = self._apply_delta(
+                previous.locations, delta["locations"]
+            )
+
+        seed_version = SeedVersion(
+            version, self.decode_tags(delta["tags"]), items, locations
+        )
+        self._cache[version] = seed_version
+        return seed_version
+
+    def record(
+        self,
+        version: int,
+        tags: int,
+        items: Sequence[Entry],
+        locations: Sequence[Entry],
+    ) -> None:
+        """
+        Add (or replace) a version at the end of the history, as a delta from
+        the version before it.
+        """
+        if any(existing > version for existing in self._versions):
+            raise ValueError(
+                f"Cannot record seed version {version} before later versions"
+            )
+
+        self._versions.pop(version, None)
+        self._cache.pop(version, None)
+
+        delta: Dict[str, Any] = {"tags": self.encode_tags(tags)}
+        if not self._versions:
+            delta["base"] = {
+                "items": [[n, self.encode_tags(t)] for n, t in items],
+                "locations": [[n, self.encode_tags(t)] for n, t in locations],
+            }
+        else:
+            previous = self.load(max(self._versions))
+            delta["items"] = self._diff(previous.items, items)
+            delta["locations"] = self._diff(previous.locations, locations)
+
+        self._versions[version] = delta
+
+    def _diff(
+        self, old: Sequence[Entry], new: Sequence[Entry]
+    ) -> Dict[str, Any]:
+        delete: List[str] = []
+        retag: List[List[Any]] = []
+        insert: List[List[Any]] = []
+
+        matcher = difflib.SequenceMatcher(
+            None, [name for name, _ in old], [name for name, _ in new], False
+        )
+        for (
+            operation,
+            old_start,
+            old_end,
+            new_start,
+            new_end,
+        ) in matcher.get_opcodes():
+            if operation == "equal":
+                for (name, old_tags), (_, new_tags) in zip(
+                    old[old_start:old_end], new[new_start:new_end]
+                ):
+                    if old_tags != new_tags:
+                        retag.append([name, self.encode_tags(new_tags)])
+                continue
+
+            for name, _ in old[old_start:old_end]:
+                delete.append(name)
+            for position in range(new_start, new_end):
+                name, tags = new[position]
+                insert.append([position, name, self.encode_tags(tags)])
+
+        delta: Dict[str, Any] = {}
+        if delete:
+            delta["delete"] = delete
+        if retag:
+            delta["retag"] = retag
+        if insert:
+            delta["insert"] = insert
+        return delta
+
+    def save(self) -> None:
+        def dump(value: Any) -> str:
+            return json.dumps(value, ensure_ascii=False)
+
+        def dump_list(key: str, values: Sequence[Any], indent: str) -> str:
+            lines = f",\n{indent}    ".join(dump(value) for value in values)
+            return f'{indent}"{key}": [\n{indent}    {lines}\n{indent}]'
+
+        sections: List[str] = []
+        for version in self.versions:
+            delta = self._versions[version]
+
+            fields = [f'        "tags": {dump(delta["tags"])}']
+            if "base" in delta:
+                fields.append(
+                    '        "base": {\n'
+                    + ",\n".join(
+                        dump_list(key, delta["base"][key], "            ")
+                        for key in ("items", "locations")
+                    )
+                    + "\n        }"
+                )
+            else:
+                for key in ("items", "locations"):
+                    operations = [
+                        dump_list(operation, values, "            ")
+                        for operation, values in delta[key].items()
+                    ]
+                    if not operations:
+                        fields.append(f'        "{key}": {{}}')
+                        continue
+                    fields.append(
+                        f'        "{key}": {{\n'
+                        + ",\n".join(operations)
+                        + "\n        }"
+                    )
+
+            sections.append(
+                f'    "{version}": {{\n' + ",\n".join(fields) + "\n    }"
+            )
+
+        with open(history_path(self.game), "w", encoding="utf-8") as file:
+            file.write(
+                "{\n"
+                f'"tags": {dump(self.tag_bits)},\n'
+                '"versions": {\n' + ",\n".join(sections) + "\n}\n}\n"
+            )
+
+
+_histories: Dict[str, History] = dict()
+
+
+def load_history(game: str) -> History:
+    history = _histories.get(game)
+    if not history:
+        history = _histories[game] = History(game)
+    return history
+
+
+def load(game: str, version: int) -> SeedVersion:
+    return load_history(game).load(version)
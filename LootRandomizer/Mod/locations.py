@@ -141,25 +141,14 @@ class Location:
             self.tags |= Tag.MissionLocation
 
             from .missions import Mission
+            from . import catalog
 
-            if BL2:
-                from .bl2.locations import Locations
-            elif TPS:
-                from .tps.locations import Locations
-            else:
-                raise
-
-            for location in Locations:
-                if (
-                    isinstance(location, Mission)
-                    and location.name == self.mission_name
-                ):
-                    self.mission = location
-                    break
-            else:
+            mission = catalog.find_named(Mission, self.mission_name)
+            if not mission:
                 raise ValueError(
                     f"Failed to match mission {self.mission_name}"
                 )
+            self.mission = mission
 
             self.tags |= self.mission.tags
             self.content = self.mission.content
@@ -16,7 +16,7 @@ from unrealsdk import (
     UObject,
 )
 
-from . import items, options, seed
+from . import items, locations, options, seed
 from .defines import *
 from .locations import Dropper, Location, MapDropper, RegistrantDropper
 
@@ -50,6 +50,18 @@ class PlaythroughDelegate(MapDropper):
         self.playthrough = 2
 
 
+def reset_playthrough() -> None:
+    """
+    The playthrough delegate stays enabled when switching seeds, so have it
+    handle the new seed's missions as it would after being enabled.
+    """
+    for dropper in MapDropper.Registrants("*"):
+        if isinstance(dropper, PlaythroughDelegate):
+            dropper.playthrough = 2
+            if locations.map_name != locations.menu_map_name:
+                dropper.entered_map()
+
+
 def Enable() -> None:
     RunHook(
         "WillowGame.WillowPlayerController.AcceptMission",
@@ -5,13 +5,14 @@ from unrealsdk import RunHook, RemoveHook, UObject, UFunction, FStruct
 
 from Mods import ModMenu
 
-from . import options, hints, seed
+from . import options, hints, seed, tracker, feed, seedlist, seedindex
+from . import resolver, catalog, startupcache
 from .defines import *
 from .seed import Seed
 
 import os
 
-from typing import Callable, Dict, List, Optional, Sequence, Set, Union
+from typing import Callable, Dict, List, Optional, Sequence, Union
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,53 +29,81 @@ def SaveSettings() -> None:
 OwnedContent = Tag.BaseGame
 
 
-def _LoadSeeds() -> Sequence[str]:
-    listed_seeds: List[str] = ["Default"]
-
-    if not os.path.exists(seeds_dir):
-        os.mkdir(seeds_dir)
-    elif not os.path.isdir(seeds_dir):
-        Log(f"Could not open seeds directory at {seeds_dir}")
-        return listed_seeds
-
-    if os.path.exists(seeds_file):
-        if not os.path.isfile(seeds_file):
-            Log(f"Could not open seeds file at {seeds_file}")
-            return listed_seeds
-    else:
-        with open(seeds_file, "w"):
-            pass
+SeedLibrary = seedlist.SeedList(seeds_file)
 
-    default_seed_string = Seed.Default().string
+_startup_cache: Optional[startupcache.StartupCache] = None
 
-    with open(seeds_file) as file:
-        for line in file:
-            line = line.strip()
-            if line == "" or line == default_seed_string:
-                continue
 
-            try:
-                listed_seed = Seed.FromString(line)
-            except ValueError as error:
-                Log(error)
-                continue
+def _StartupCache() -> startupcache.StartupCache:
+    """The current profile's startup cache, loaded again if it has changed."""
+    global _startup_cache
+    profile = seed.profile_directory()
+    if not _startup_cache or _startup_cache.profile != profile:
+        installed_dlcs = startupcache.installed_dlcs(mod_dir)
+        _startup_cache = startupcache.StartupCache(
+            seed.assignments_dir,
+            profile,
+            catalog=catalog.digest().hex(),
+            version=CurrentVersion,
+            dlcs=installed_dlcs,
+        )
+        # Without a DLC folder to check, owned content is probed each session.
+        if installed_dlcs is None:
+            _startup_cache.values.pop("owned_content", None)
+    return _startup_cache
+
+
+def DefaultSeedString() -> str:
+    """The string of the current profile's default seed."""
+    return Seed.Default().string
+
+
+_SeedRecords = seedindex.SeedIndex(seeds_dir)
 
-            if listed_seed.string not in listed_seeds:
-                listed_seeds.append(listed_seed.string)
 
-    return listed_seeds
+def _SeedDetails(seed_string: str) -> str:
+    """
+    Describe a listed seed from its record in the seeds index, or failing
+    that, from what its string encodes.
+    """
+    if seed_string == "Default":
+        seed_string = DefaultSeedString()
+
+    record = _SeedRecords.load().get(seed_string)
+    if not record or "dlcs" not in record:
+        try:
+            _, version, tags = resolver.decode_seed(seed_string)
+        except ValueError:
+            return ""
+        record = {"version": version, **seed.seed_metadata(Tag(tags))}
+
+    return seedindex.describe(record)
+
+
+def _LoadSeeds() -> Sequence[str]:
+    default_seed_string = DefaultSeedString()
+    return [
+        "Default",
+        *(
+            listed_seed
+            for listed_seed in SeedLibrary.load()
+            if listed_seed != default_seed_string
+        ),
+    ]
 
 
 def _PrepareSelectSeed() -> None:
     _SeedsList.Choices = _LoadSeeds()
 
     if _CurrentSeed.CurrentValue in _SeedsList.Choices:
+        _SeedsList.Description = _SeedDetails(_SeedsList.CurrentValue)
         return
 
     if seed.AppliedSeed:
         seed.AppliedSeed.unapply()
 
     _SeedsList.CurrentValue = _SeedsList.StartingValue
+    _SeedsList.Description = _SeedDetails(_SeedsList.StartingValue)
 
 
 def _SeedApplied() -> None:
@@ -99,18 +128,6 @@ def ShowSeedOptions() -> None:
     _EditSeedFileButton.IsHidden = False
 
 
-def SaveSeedString(seed_string: str) -> None:
-    with open(seeds_file, "a+") as file:
-        file.seek(0, 0)
-        seeds = file.read()
-
-        if len(seeds) > 0 and seeds[-1] not in "\n\r":
-            file.write("\n")
-
-        if seed_string not in seeds:
-            file.write(seed_string + "\n")
-
-
 def _NewSeedGenerateClicked() -> None:
     tags = Tag(0)
 
@@ -127,49 +144,57 @@ def _NewSeedGenerateClicked() -> None:
 
     SaveSettings()
 
-    show_dialog(
-        "Seed Generated and Applied",
-        "You will now see the seed's randomization in your game.\n\n"
-        "You can review information about the seed in Loot Randomizer options.",
-        1,
-    )
+    SeedLibrary.add(new_seed.string)
+
+    def applied() -> None:
+        _SeedApplied()
+        show_dialog(
+            "Seed Generated and Applied",
+            "You will now see the seed's randomization in your game.\n\n"
+            "You can review information about the seed in Loot Randomizer "
+            "options.",
+            1,
+        )
 
-    SaveSeedString(new_seed.string)
+    new_seed.apply_async(on_finished=applied, on_failed=_SeedApplyFailed)
 
-    new_seed.apply()
-    _SeedApplied()
+
+def _SeedApplyFailed(error: Exception) -> None:
+    show_dialog("Cannot Apply Seed", str(error), 1)
 
 
 def _SelectSeedApplyClicked() -> None:
     if _SeedsList.LootRandomizer_staged == _SeedsList.StartingValue:
-        seed = Seed.Default()
+        seed = Seed.FromString(DefaultSeedString())
     else:
         seed = Seed.FromString(_SeedsList.LootRandomizer_staged)
 
-    try:
-        seed.apply()
-    except Exception as error:
-        show_dialog("Cannot Apply Seed", str(error), 1)
-        return
+    staged = _SeedsList.LootRandomizer_staged
 
-    _CurrentSeed.CurrentValue = _SeedsList.LootRandomizer_staged
+    def applied() -> None:
+        _SeedApplied()
+        _CurrentSeed.CurrentValue = staged
 
-    SaveSettings()
-    _SeedApplied()
-    show_dialog(
-        "Seed Applied",
-        "You will now see the seed's randomization in your game.",
-    )
+        SaveSettings()
+        show_dialog(
+            "Seed Applied",
+            "You will now see the seed's randomization in your game.",
+        )
+
+    try:
+        seed.apply_async(on_finished=applied, on_failed=_SeedApplyFailed)
+    except Exception as error:
+        _SeedApplyFailed(error)
 
 
 def _SeedTrackerClicked() -> None:
-    if not seed.AppliedSeed:
+    if not seed.AppliedSeed or seed.AppliedSeed.applying:
         return
-    os.startfile(seed.AppliedSeed.generate_tracker())
+    seed.AppliedSeed.generate_tracker(os.startfile)
 
 
 def _PopulateHintsClicked() -> None:
-    if not seed.AppliedSeed:
+    if not seed.AppliedSeed or seed.AppliedSeed.applying:
         return
 
     seed_string = seed.AppliedSeed.string
@@ -200,7 +225,7 @@ def _PopulateHintsClicked() -> None:
 
 
 def _PopulateSpoilersClicked() -> None:
-    if not seed.AppliedSeed:
+    if not seed.AppliedSeed or seed.AppliedSeed.applying:
         return
 
     seed_string = seed.AppliedSeed.string
@@ -230,6 +255,38 @@ def _PopulateSpoilersClicked() -> None:
     )
 
 
+def _TrackerFeedChanged(value: str) -> None:
+    if not getattr(options, "mod_instance", None):
+        return
+    if not mod_instance.IsEnabled:
+        return  # The feed is started when the mod is enabled.
+
+    if value == "On":
+        feed.start()
+        if seed.AppliedSeed:
+            seed.AppliedSeed.publish_tracker()
+    else:
+        feed.stop()
+
+
+def _TrackerDatabaseChanged(value: str) -> None:
+    if not getattr(options, "mod_instance", None):
+        return
+
+    if value == "On":
+        # Trackers are only recorded in full as they start, so record the
+        # current one before its lines are updated.
+        if seed.AppliedSeed and not seed.AppliedSeed.applying:
+            seed.AppliedSeed.store_tracker()
+    else:
+        seed.close_tracker_store()
+
+
+def _RichTrackerChanged(value: str) -> None:
+    if getattr(options, "mod_instance", None) and seed.AppliedSeed:
+        seed.AppliedSeed.render_rich_tracker()
+
+
 def _ResetDismissedClicked() -> None:
     show_dialog(
         "Dismissed Hints Reset", "All hints items will now appear again."
@@ -242,27 +299,60 @@ def _WillowScrollingListOnClikEvent(
 ) -> bool:
     """
     Copied from ModMenu.OptionManager to detect clicking of menu items, modified
-    to detect the descriptions of our "buttons."
+    to look up our "buttons" in the menu shown, as recorded when it was built.
     """
     if params.Data.Type != "itemClick":
         return True
 
-    provider = None
-    for obj in caller.DataProviderStack:
-        provider = obj.DataProvider.ObjectPointer
-    if provider is None or provider.GetDescription is None:
+    stack = caller.DataProviderStack
+    if not len(stack):
+        return True
+    provider = stack[len(stack) - 1].DataProvider.ObjectPointer
+    buttons = _menu_buttons.get(provider)
+    if not buttons:
         return True
 
-    event_id = caller.IndexToEventId[params.Data.Index]
-    event_description = provider.GetDescription(event_id)
+    button = buttons.get(caller.IndexToEventId[params.Data.Index])
+    if button:
+        button.Callback()
+
+    return True
+
+
+def _OptionsPopulate(caller: UObject, _f: UFunction, params: FStruct) -> bool:
+    # The menu is being built again; the menus no longer open beneath it are
+    # forgotten along with its earlier buttons.
+    shown = [
+        entry.DataProvider.ObjectPointer
+        for entry in params.TheList.DataProviderStack
+    ]
+    for provider in list(_menu_buttons):
+        if provider not in shown:
+            del _menu_buttons[provider]
+    _menu_buttons[caller] = dict()
+    return True
 
-    for button in _callback_options:
-        if event_description == button.Description:
-            button.Callback()
 
+def _OptionsAddDescription(
+    caller: UObject, _f: UFunction, params: FStruct
+) -> bool:
+    button = _MarkedCallbackOption(params.Description)
+    if button:
+        _menu_buttons.setdefault(caller, dict())[params.EventID] = button
     return True
 
 
+def _MarkedCallbackOption(
+    description: str,
+) -> Optional[Union[CallbackField, CallbackNested]]:
+    # Our buttons' descriptions end with their marker, which is looked up as
+    # is; other mods' descriptions are let through after a single search.
+    marker_start = description.rfind(_MARKER_PREFIX)
+    if marker_start < 0:
+        return None
+    return _callback_options.get(description[marker_start:])
+
+
 def _PostLogin(caller: UObject, _f: UFunction, params: FStruct) -> bool:
     if params.NewPlayer == get_pc():
         return True
@@ -278,7 +368,19 @@ def _PostBeginPlay(caller: UObject, _f: UFunction, params: FStruct) -> bool:
     return True
 
 
-_callback_options: Set[Union[CallbackField, CallbackNested]] = set()
+_MARKER_PREFIX = f"<!-- {__package__}."
+
+# Our buttons by the marker ending their descriptions.
+_callback_options: Dict[str, Union[CallbackField, CallbackNested]] = dict()
+
+# Our buttons by event ID within each options menu open, by its data provider.
+_menu_buttons: Dict[
+    UObject, Dict[int, Union[CallbackField, CallbackNested]]
+] = dict()
+
+
+def _CallbackMarker(option: ModMenu.Options.Base) -> str:
+    return f"{_MARKER_PREFIX}{id(option)} -->"
 
 
 class CallbackField(ModMenu.Options.Field):
@@ -288,11 +390,11 @@ class CallbackField(ModMenu.Options.Field):
         self, Caption: str, Description: str, Callback: Callable[[], None]
     ) -> None:
         self.Caption = Caption
-        self.Description = f"{Description}<!-- {__package__}.{id(self)} -->"
+        self.Description = Description + _CallbackMarker(self)
         self.IsHidden = False
         self.Callback = Callback
 
-        _callback_options.add(self)
+        _callback_options[_CallbackMarker(self)] = self
 
 
 class CallbackNested(ModMenu.Options.Nested):
@@ -306,12 +408,10 @@ class CallbackNested(ModMenu.Options.Nested):
         Children: Sequence[ModMenu.Options.Base],
     ) -> None:
         super().__init__(
-            Caption,
-            f"{Description}<!-- {__package__}.{id(self)} -->",
-            Children,
+            Caption, Description + _CallbackMarker(self), Children
         )
         self.Callback = Callback
-        _callback_options.add(self)
+        _callback_options[_CallbackMarker(self)] = self
 
 
 class CallbackSpinner(ModMenu.Options.Spinner):
@@ -368,6 +468,7 @@ class SeedListSpinner(ModMenu.Options.Spinner):
     @CurrentValue.setter
     def CurrentValue(self, value: str) -> None:
         self.LootRandomizer_staged = value
+        self.Description = _SeedDetails(value)
 
 
 _SeedsList = SeedListSpinner()
@@ -384,12 +485,46 @@ elif TPS:
 else:
     raise
 
-_NewSeedOptions = ModMenu.Options.Nested(
+# The content owned as of when the New Seed options were last built; they are
+# only built once opened, and built again should more content be owned.
+_NewSeedContent: Optional[Tag] = None
+
+
+def _PrepareNewSeed() -> None:
+    global _NewSeedContent
+    if _NewSeedContent == OwnedContent:
+        return
+    _NewSeedContent = OwnedContent
+
+    categories: Dict[str, List[Tag]] = dict()
+    for tag in TagList:
+        if hasattr(tag, "category"):
+            tag_list = categories.setdefault(tag.category, [])
+            tag_list.append(tag)
+
+    _NewSeedOptions.Children = []
+
+    for category, tags in categories.items():
+        _NewSeedOptions.Children.append(SeedHeader(category))
+        for tag in tags:
+            _NewSeedOptions.Children.append(SeedOption(tag))
+
+    _NewSeedOptions.Children.append(_GenerateSeedButton)
+
+
+_GenerateSeedButton = CallbackField(
+    "GENERATE SEED",
+    "Confirm selections and and generate the new seed.",
+    _NewSeedGenerateClicked,
+)
+
+_NewSeedOptions = CallbackNested(
     Caption="New Seed",
     Description=(
         "Create a new seed. Each seed defines a shuffling of loot sources that "
         "is consistent each time you play it."
     ),
+    Callback=_PrepareNewSeed,
     Children=(),
 )
 
@@ -433,6 +568,39 @@ AutoLog = ModMenu.Options.Boolean(
     StartingValue=True,
 )
 
+TrackerDatabase = CallbackSpinner(
+    Caption="Keep Tracker Database",
+    Description=(
+        "Whether to also record every seed's tracker in a database in the "
+        "Seeds folder, so that tools can search across seeds."
+    ),
+    Callback=_TrackerDatabaseChanged,
+    Choices=("Off", "On"),
+    StartingValue="Off",
+)
+
+TrackerFeed = CallbackSpinner(
+    Caption="Overlay Feed",
+    Description=(
+        "Serve the selected seed's tracker to stream overlays on "
+        f"http://{feed.HOST}:{feed.PORT}, updating them as it changes."
+    ),
+    Callback=_TrackerFeedChanged,
+    Choices=("Off", "On"),
+    StartingValue="Off",
+)
+
+RichTracker = CallbackSpinner(
+    Caption="Rich Tracker",
+    Description=(
+        "Also keep an HTML or Markdown copy of the selected seed's tracker, "
+        "grouping its locations by content and by what they have dropped."
+    ),
+    Callback=_RichTrackerChanged,
+    Choices=("Off", "HTML", "Markdown"),
+    StartingValue="Off",
+)
+
 HintDisplay = CallbackSpinner(
     Caption="Hint Display",
     Description=(
@@ -473,6 +641,9 @@ Options: Sequence[ModMenu.Options.Base] = (
         Description="",
         Children=(
             AutoLog,
+            TrackerDatabase,
+            TrackerFeed,
+            RichTracker,
             CallbackField(
                 Caption="FILL IN TRACKER HINTS",
                 Description=(
@@ -528,23 +699,29 @@ class SeedOption(ModMenu.Options.Spinner):
 
 
 def Enable():
-    default_seed = seed.Seed.Default()
-    if default_seed.string not in _SeedsList.Choices:
-        SaveSeedString(default_seed.string)
+    default_seed = Seed.FromString(DefaultSeedString())
+    SeedLibrary.add(default_seed.string)
 
     global OwnedContent
-    for tag in Tag:
-        if not tag in ContentTags:
-            continue
-        dlc_path: Optional[str] = getattr(tag, "dlc_path", None)
-        if not dlc_path:
-            OwnedContent |= tag
-        else:
-            dlc = FindObject("DownloadableItemSetDefinition", dlc_path)
-            if not dlc:
-                raise Exception(f"Missing DLC object for {tag.name}")
-            if dlc_path and bool(dlc.CanUse()):
+    OwnedContent = Tag.BaseGame
+    cache = _StartupCache()
+    owned_content: Optional[int] = cache.values.get("owned_content")
+    if owned_content is not None:
+        OwnedContent |= Tag(owned_content)
+    else:
+        for tag in Tag:
+            if not tag in ContentTags:
+                continue
+            dlc_path: Optional[str] = getattr(tag, "dlc_path", None)
+            if not dlc_path:
                 OwnedContent |= tag
+            else:
+                dlc = FindObject("DownloadableItemSetDefinition", dlc_path)
+                if not dlc:
+                    raise Exception(f"Missing DLC object for {tag.name}")
+                if dlc_path and bool(dlc.CanUse()):
+                    OwnedContent |= tag
+        cache.update(owned_content=OwnedContent.value)
 
     if (
         _CurrentSeed.CurrentValue in _SeedsList.Choices
@@ -555,38 +732,30 @@ def Enable():
         _CurrentSeed.CurrentValue = _SeedsList.StartingValue
         selected_seed = default_seed
 
+    if TrackerFeed.CurrentValue == "On":
+        feed.start()
+
     try:
         selected_seed.apply()
         _SeedApplied()
     except ValueError as error:
         Log(error)
 
-    categories: Dict[str, List[Tag]] = dict()
-    for tag in TagList:
-        if hasattr(tag, "category"):
-            tag_list = categories.setdefault(tag.category, [])
-            tag_list.append(tag)
-
-    _NewSeedOptions.Children = []
-
-    for category, tags in categories.items():
-        _NewSeedOptions.Children.append(SeedHeader(category))
-        for tag in tags:
-            _NewSeedOptions.Children.append(SeedOption(tag))
-
-    _NewSeedOptions.Children.append(
-        CallbackField(
-            "GENERATE SEED",
-            "Confirm selections and and generate the new seed.",
-            _NewSeedGenerateClicked,
-        )
-    )
-
     RunHook(
         "WillowGame.WillowScrollingList.OnClikEvent",
         "LootRandomizer",
         _WillowScrollingListOnClikEvent,
     )
+    RunHook(
+        "WillowGame.WillowScrollingListDataProviderOptionsBase.Populate",
+        "LootRandomizer",
+        _OptionsPopulate,
+    )
+    RunHook(
+        "WillowGame.WillowScrollingListDataProviderOptionsBase.AddDescription",
+        "LootRandomizer",
+        _OptionsAddDescription,
+    )
     RunHook(
         "WillowGame.WillowGameInfo.PostLogin", "LootRandomizer", _PostLogin
     )
@@ -599,8 +768,21 @@ def Enable():
 
 def Disable():
     if seed.AppliedSeed:
+        seed.AppliedSeed.close_tracker()
         seed.AppliedSeed.unapply()
+    seed.close_tracker_store()
+    tracker.stop()
+    feed.stop()
 
     RemoveHook("WillowGame.WillowScrollingList.OnClikEvent", "LootRandomizer")
+    RemoveHook(
+        "WillowGame.WillowScrollingListDataProviderOptionsBase.Populate",
+        "LootRandomizer",
+    )
+    RemoveHook(
+        "WillowGame.WillowScrollingListDataProviderOptionsBase.AddDescription",
+        "LootRandomizer",
+    )
     RemoveHook("WillowGame.WillowGameInfo.PostLogin", "LootRandomizer")
     RemoveHook("WillowGame.WillowGameInfo.PostBeginPlay", "LootRandomizer")
+    _menu_buttons.clear()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json, os
+
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+# The rarities of each location's rolls are worked out when the location is
+# enabled in game. They are exported here, so that seed tooling outside of the
+# game can tell how likely a location is to drop its item. Like the history
+# module, this only relies on the standard library.
+#
+# The exported files are generated, and not to be edited by hand. They are
+# written again along with each new seed version by seed.generate_seedversion,
+# or on their own by running this from the game's console:
+#
+#   py from Mods.LootRandomizer.Mod import seed; seed.generate_rarities()
+
+
+def rarities_path(game: str) -> str:
+    return os.path.join(os.path.dirname(__file__), game, "rarities.json")
+
+
+_rarities: Dict[str, Dict[str, Tuple[int, ...]]] = dict()
+
+
+def load(game: str) -> Dict[str, Tuple[int, ...]]:
+    """
+    Returns the rarities of each location's rolls, by location name. Returns
+    an empty dictionary if none have been exported for the game.
+    """
+    rarities = _rarities.get(game)
+    if rarities is not None:
+        return rarities
+
+    path = rarities_path(game)
+    if not os.path.exists(path):
+        rarities = dict()
+    else:
+        with open(path, encoding="utf-8") as file:
+            rarities = {
+                location: tuple(rolls)
+                for location, rolls in json.load(file).items()
+            }
+
+    _rarities[game] = rarities
+    return rarities
+
+
+def missing(game: str, locations: Iterable[str]) -> List[str]:
+    """The given locations which have no rarities exported for the game."""
+    rarities = load(game)
+    return [location for location in locations if location not in rarities]
+
+
+def write(game: str, rarities: Mapping[str, Sequence[int]]) -> str:
+    path = rarities_path(game)
+    lines = ",\n".join(
+        f"{json.dumps(location, ensure_ascii=False)}: {json.dumps(list(rolls))}"
+        for location, rolls in rarities.items()
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("{\n" + lines + "\n}\n")
+
+    _rarities.pop(game, None)
+    return path
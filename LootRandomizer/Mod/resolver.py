@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from base64 import b32encode, b32decode
+import random
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+# Resolves which item each location of a seed holds from the seed version
+# history alone. Like the history module, this only relies on the standard
+# library, so that seeds can be worked out outside of the game; the game's own
+# seeds shuffle their items with the same function.
+
+if __package__:
+    from . import history
+else:
+    import history
+
+
+# The name of the item padding out seeds with fewer items than locations.
+DUD_ITEM = "Nothing"
+
+T = TypeVar("T")
+
+
+def stringify(data: bytes) -> str:
+    string = b32encode(data).decode("ascii").strip("=").lower()
+    return f"{string[0:5]}-{string[5:10]}-{string[10:15]}"
+
+
+def encode_seed(value: int, tags: int, version: int) -> bytes:
+    data = (value << 42) | (tags << 6) | version
+    return data.to_bytes(length=9, byteorder="big")
+
+
+def decode_seed(seed: Union[str, bytes]) -> Tuple[bytes, int, int]:
+    """
+    Returns the data of a seed, given either as a string or as its data,
+    along with the seed version and tags it encodes.
+    """
+    if isinstance(seed, str):
+        try:
+            data = b32decode(
+                "".join(char.upper() for char in seed if char.isalnum()) + "="
+            )
+            assert len(data) == 9
+        except:
+            raise ValueError(
+                "Failed to read seed with invalid format: " + seed
+            )
+    else:
+        data = bytes(seed)
+        if len(data) != 9:
+            raise ValueError(f"Seed data must be 9 bytes, not {len(data)}")
+
+    value = int.from_bytes(bytes=data, byteorder="big")
+    version = (2**6 - 1) & value
+    tags = (2**36 - 1) & (value >> 6)
+    return data, version, tags
+
+
+def shuffle_items(
+    data: bytes,
+    items: Sequence[T],
+    location_count: int,
+    duplicate_items: bool,
+    dud_item: T,
+) -> List[T]:
+    """
+    Shuffle a seed's items into the order of its locations. Seeds with more
+    locations than items either repeat items or pad them out with duds.
+    """
+    shuffled = list(items)
+    item_count = len(shuffled)
+
+    randomizer = random.Random(data)
+
+    if location_count < item_count:
+        shuffled = randomizer.sample(shuffled, location_count)
+
+    elif location_count == item_count:
+        randomizer.shuffle(shuffled)
+
+    elif duplicate_items:
+        shuffled *= location_count // item_count
+        shuffled += randomizer.sample(shuffled, location_count % item_count)
+        randomizer.shuffle(shuffled)
+
+    else:
+        shuffled += [dud_item] * (location_count - item_count)
+        randomizer.shuffle(shuffled)
+
+    return shuffled
+
+
+class Resolution(NamedTuple):
+    string: str
+    game: str
+    version: int
+    tags: int
+    item_count: int
+    assignment: Tuple[Tuple[str, str], ...]
+
+
+def resolve(
+    seed: Union[str, bytes], game: str, version: Optional[int] = None
+) -> Resolution:
+    """
+    Returns the location and item names of a seed, in the order the seed
+    assigns them. The version defaults to the one encoded in the seed.
+    """
+    data, seed_version, tags = decode_seed(seed)
+    if version is None:
+        version = seed_version
+    elif version != seed_version:
+        raise ValueError(
+            f"Seed {stringify(data)} is version {seed_version}, not {version}"
+        )
+
+    seed_history = history.load_history(game)
+    seed_version_data = seed_history.load(version)
+
+    items = [
+        name for name, item_tags in seed_version_data.items if item_tags & tags
+    ]
+    locations = [
+        name
+        for name, location_tags in seed_version_data.locations
+        if location_tags & tags == location_tags
+    ]
+
+    duplicate_items = bool(tags & seed_history.tag_bits["DuplicateItems"])
+    shuffled = shuffle_items(
+        data, items, len(locations), duplicate_items, DUD_ITEM
+    )
+
+    return Resolution(
+        stringify(data),
+        game,
+        version,
+        tags,
+        len(items),
+        tuple(zip(locations, shuffled)),
+    )
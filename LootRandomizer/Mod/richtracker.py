@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import html, os, threading
+
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
+
+from .store import LOGGED_NONE, LOGGED_HINT, LOGGED_FULL
+
+# Besides its text tracker, a seed's tracker may also be rendered as an HTML or
+# Markdown document. Each content section lists its locations by what has been
+# logged for them: the items found, then the hints by tier, then the locations
+# yet to be explored, along with how many rolls each location has.
+#
+# The document is rendered section by section, and each rendered section is
+# kept, so that only the sections with changed locations are rendered again.
+# The document is then written out by the tracker writer.
+
+FORMATS = ("HTML", "Markdown")
+EXTENSIONS = {"HTML": ".html", "Markdown": ".md"}
+
+
+class Entry:
+    location: str
+    rolls: int
+    logged: int
+    value: str
+
+    def __init__(self, location: str, rolls: int, logged: int, value: str):
+        self.location = location
+        self.rolls = rolls
+        self.logged = logged
+        self.value = value
+
+
+def _markdown_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("|", "\\|")
+
+
+def _markdown_section(
+    title: str, groups: Sequence[Tuple[str, Sequence[Entry], bool]]
+) -> str:
+    parts = [f"\n## {_markdown_text(title)}\n"]
+    for caption, entries, show_value in groups:
+        parts.append(f"\n### {_markdown_text(caption)}\n\n")
+        if show_value:
+            parts.append("| Location | Rolls | Item |\n|---|---|---|\n")
+        else:
+            parts.append("| Location | Rolls |\n|---|---|\n")
+        for entry in entries:
+            row = f"| {_markdown_text(entry.location)} | {entry.rolls} |"
+            if show_value:
+                row += f" {_markdown_text(entry.value)} |"
+            parts.append(row + "\n")
+    return "".join(parts)
+
+
+def _html_section(
+    title: str, groups: Sequence[Tuple[str, Sequence[Entry], bool]]
+) -> str:
+    parts = [f"<section>\n<h2>{html.escape(title)}</h2>\n"]
+    for caption, entries, show_value in groups:
+        parts.append(f"<h3>{html.escape(caption)}</h3>\n<table>\n<tr>")
+        parts.append("<th>Location</th><th>Rolls</th>")
+        if show_value:
+            parts.append("<th>Item</th>")
+        parts.append("</tr>\n")
+        for entry in entries:
+            parts.append(
+                f"<tr><td>{html.escape(entry.location)}</td>"
+                f"<td>{entry.rolls}</td>"
+            )
+            if show_value:
+                parts.append(f"<td>{html.escape(entry.value)}</td>")
+            parts.append("</tr>\n")
+        parts.append("</table>\n")
+    parts.append("</section>\n")
+    return "".join(parts)
+
+
+_HTML_HEAD = (
+    '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+    "<title>{title}</title>\n<style>\n"
+    "body {{ font-family: sans-serif; }}\n"
+    "table {{ border-collapse: collapse; margin-bottom: 1em; }}\n"
+    "td, th {{ border: 1px solid #888; padding: 2px 8px; text-align: left; }}\n"
+    "</style>\n</head>\n<body>\n<h1>{title}</h1>\n"
+)
+
+
+class RichTracker:
+    path: str
+    format: str
+
+    _header: str
+    _footer: str
+    # The entries of each section by title, and each location's entry along
+    # with the titles of the sections it appears in.
+    _sections: Dict[str, List[Entry]]
+    _entries: Dict[str, Tuple[Entry, List[str]]]
+    _hint_order: Dict[str, int]
+
+    # Only held to change the rendered sections or copy them.
+    _lock: threading.Lock
+    _rendered: Dict[str, str]
+    _changed: Set[str]
+    _write_queued: bool = False
+    _queue_write: Callable[[Callable[[], None]], None]
+
+    def __init__(
+        self,
+        path: str,
+        format: str,
+        title: str,
+        summary: Sequence[str],
+        sections: Dict[str, List[Entry]],
+        hint_order: Sequence[str],
+        queue_write: Callable[[Callable[[], None]], None],
+    ) -> None:
+        """
+        Create a rich tracker at the given path, without extension, in the
+        given format. Sections list the same entry for a location appearing in
+        several of them. Writing the tracker is queued with queue_write.
+        """
+        self.path = path + EXTENSIONS[format]
+        self.format = format
+        self._sections = sections
+        self._hint_order = {
+            hint: index for index, hint in enumerate(hint_order)
+        }
+        self._queue_write = queue_write
+        self._lock = threading.Lock()
+
+        self._entries = dict()
+        for section_title, entries in sections.items():
+            for entry in entries:
+                if entry.location not in self._entries:
+                    self._entries[entry.location] = (entry, [])
+                self._entries[entry.location][1].append(section_title)
+
+        if format == "HTML":
+            self._header = _HTML_HEAD.format(title=html.escape(title))
+            self._header += "".join(
+                f"<p>{html.escape(line)}</p>\n" for line in summary
+            )
+            self._footer = "</body>\n</html>\n"
+        else:
+            self._header = f"# {_markdown_text(title)}\n\n" + "".join(
+                f"{_markdown_text(line)}  \n" for line in summary
+            )
+            self._footer = ""
+
+        self._rendered = dict.fromkeys(sections, "")
+        self._changed = set(sections)
+        self._render()
+
+    def _groups(
+        self, entries: Sequence[Entry]
+    ) -> List[Tuple[str, Sequence[Entry], bool]]:
+        found = [entry for entry in entries if entry.logged == LOGGED_FULL]
+        unexplored = [
+            entry for entry in entries if entry.logged == LOGGED_NONE
+        ]
+
+        hinted: Dict[str, List[Entry]] = dict()
+        for entry in entries:
+            if entry.logged == LOGGED_HINT:
+                hinted.setdefault(entry.value, []).append(entry)
+
+        groups: List[Tuple[str, Sequence[Entry], bool]] = []
+        if found:
+            groups.append(("Found", found, True))
+        for hint in sorted(
+            hinted, key=lambda hint: self._hint_order.get(hint, -1)
+        ):
+            groups.append((f"Hinted: {hint}", hinted[hint], False))
+        if unexplored:
+            groups.append(("Unexplored", unexplored, False))
+        return groups
+
+    def _render(self) -> None:
+        render_section = (
+            _html_section if self.format == "HTML" else _markdown_section
+        )
+        rendered = {
+            section_title: render_section(
+                section_title, self._groups(self._sections[section_title])
+            )
+            for section_title in self._changed
+        }
+        self._changed.clear()
+
+        with self._lock:
+            self._rendered.update(rendered)
+
+        if not self._write_queued:
+            self._write_queued = True
+            self._queue_write(self.write)
+
+    def update(self, logs: Iterable[Tuple[str, int, str]]) -> None:
+        """
+        Log locations, given by name along with how much of them is logged and
+        what is logged, rendering the sections they appear in again.
+        """
+        for location, logged, value in logs:
+            if location in self._entries:
+                entry, section_titles = self._entries[location]
+                entry.logged = logged
+                entry.value = value
+                self._changed.update(section_titles)
+
+        if self._changed:
+            self._render()
+
+    def write(self) -> None:
+        """Write out the document. Only called by the tracker writer."""
+        self._write_queued = False
+        with self._lock:
+            sections = list(self._rendered.values())
+
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self._header)
+            file.writelines(sections)
+            file.write(self._footer)
+        os.replace(temporary_path, self.path)
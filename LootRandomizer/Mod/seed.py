@@ -4,32 +4,45 @@ from unrealsdk import Log
 
 from .defines import *
 
-from . import options, items, hints, enemies, missions
+from . import options, items, hints, enemies, missions, catalog, history
+from . import feed, resolver, richtracker, seedindex, store
 from .locations import Location
 from .items import ItemPool
+from .catalog import Items, Locations, module_name
+from .tracker import Tracker, run_on_writer
 
-from base64 import b32encode, b32decode
-import random, os, importlib
+import hashlib, random, os, struct, time
 
-from typing import List, Optional, Sequence
-from types import ModuleType
+from concurrent.futures import Future
 
-if BL2:
-    module_name = "bl2"
-    from .bl2.items import Items
-    from .bl2.locations import Locations
-elif TPS:
-    module_name = "tps"
-    from .tps.items import Items
-    from .tps.locations import Locations
-else:
-    raise
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from typing import Sequence, Tuple, Union, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .versiontable import VersionTable
 
 AppliedSeed: Optional[Seed] = None
 AppliedTags: Tag = Tag(0)
 
 
+# Resolved seeds are cached as the final location-to-item assignment, by the
+# catalog index of each. A cached assignment is only valid for the catalog and
+# the seed version contents whose digests it was written with. Only the most
+# recently used assignments are kept.
+assignments_dir = os.path.join(seeds_dir, "Cache")
+
+_ASSIGNMENT_MAGIC = b"LRSA"
+_ASSIGNMENT_FORMAT = 2
+_ASSIGNMENT_LIMIT = 200
+_DUD_INDEX = 0xFFFF
+
+# magic, format, seed data, catalog digest, version digest, item count,
+# assignment count
+_assignment_header = struct.Struct("<4sH9s16s16sHH")
+# location index, item index
+_assignment = struct.Struct("<HH")
+
+
 class SeedEntry:
     __slots__ = ("name", "tags")
 
@@ -41,23 +54,224 @@ class SeedEntry:
         self.tags = tags
 
     def match_item(self) -> ItemPool:
-        for item in Items:
-            if item.name == self.name:
-                return item
+        item = catalog.find_item(self.name)
+        if item:
+            return item
         raise ValueError(f"Could not locate item for seed entry '{self.name}'")
 
     def match_location(self) -> Location:
-        for location in Locations:
-            if str(location) == self.name:
-                return location
+        location = catalog.find_location(self.name)
+        if location:
+            return location
         raise ValueError(
             f"Could not locate location for seed entry '{self.name}'"
         )
 
 
-def _stringify(data: bytes) -> str:
-    string = b32encode(data).decode("ascii").strip("=").lower()
-    return f"{string[0:5]}-{string[5:10]}-{string[10:15]}"
+class SeedVersion:
+    Tags: Tag
+    Items: Sequence[SeedEntry]
+    Locations: Sequence[SeedEntry]
+
+    def __init__(self, seed_version: history.SeedVersion) -> None:
+        self.Tags = Tag(seed_version.tags)
+        self.Items = tuple(
+            SeedEntry(name, Tag(tags)) for name, tags in seed_version.items
+        )
+        self.Locations = tuple(
+            SeedEntry(name, Tag(tags)) for name, tags in seed_version.locations
+        )
+
+
+_seed_versions: Dict[int, SeedVersion] = dict()
+
+
+# The item a location was enabled with, and the missions sharing its mission
+# definition in the order they appeared in the seed.
+_ActivationKey = Tuple[Optional[ItemPool], Tuple[Location, ...]]
+
+# Every location currently enabled, along with the key it was enabled with.
+_enabled_locations: Dict[Location, _ActivationKey] = dict()
+
+_mission_groups_cache: Optional[Dict[Location, Sequence[Location]]] = None
+
+
+def _mission_groups() -> Dict[Location, Sequence[Location]]:
+    global _mission_groups_cache
+    if _mission_groups_cache is not None:
+        return _mission_groups_cache
+
+    definitions: Dict[Tuple[type, Sequence[str]], List[Location]] = dict()
+    for location in Locations:
+        if not isinstance(location, missions.Mission):
+            continue
+        for dropper in location.droppers:
+            if isinstance(dropper, missions.MissionDefinition):
+                key = (dropper.__class__, tuple(dropper.paths))
+                definitions.setdefault(key, []).append(location)
+
+    _mission_groups_cache = dict()
+    for group in definitions.values():
+        if len(group) < 2:
+            continue
+        for location in group:
+            members = _mission_groups_cache.setdefault(location, [])
+            members += (member for member in group if member not in members)
+
+    return _mission_groups_cache
+
+
+def load_history_version(version: int) -> SeedVersion:
+    seed_version = _seed_versions.get(version)
+    if not seed_version:
+        seed_version = SeedVersion(history.load(module_name, version))
+        _seed_versions[version] = seed_version
+    return seed_version
+
+
+_version_digests: Dict[object, bytes] = dict()
+
+
+def version_digest(version_table: Union[VersionTable, SeedVersion]) -> bytes:
+    """A hash of the tags and entries of a loaded seed version."""
+    digest = _version_digests.get(version_table)
+    if digest is None:
+        contents = "\n".join(
+            (
+                str(int(version_table.Tags)),
+                *(
+                    f"{entry.name}\t{int(entry.tags)}"
+                    for entry in version_table.Items
+                ),
+                "",
+                *(
+                    f"{entry.name}\t{int(entry.tags)}"
+                    for entry in version_table.Locations
+                ),
+            )
+        )
+        digest = hashlib.md5(contents.encode("utf-8")).digest()
+        _version_digests[version_table] = digest
+    return digest
+
+
+def _prune_assignments() -> None:
+    """Remove all but the most recently used cached assignments."""
+    try:
+        paths = [
+            entry.path
+            for entry in os.scandir(assignments_dir)
+            if entry.name.endswith(".bin")
+        ]
+        if len(paths) <= _ASSIGNMENT_LIMIT:
+            return
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[_ASSIGNMENT_LIMIT:]:
+            os.remove(path)
+    except OSError as error:
+        Log(f"Could not prune cached assignments: {error}")
+
+
+def load_version(version: int) -> Union[VersionTable, SeedVersion]:
+    from . import versiontable
+
+    table = versiontable.load(version)
+    if table:
+        return table
+
+    return load_history_version(version)
+
+
+# Seconds of work to do per tick when applying a seed asynchronously.
+_APPLY_BUDGET = 0.004
+
+# Seconds between checks of the tracker file for changes made outside of the
+# game, when updating the tracker.
+TRACKER_SYNC_INTERVAL = 1.0
+
+
+_tracker_store: Optional[store.TrackerStore] = None
+
+
+def _store_trackers(work: Callable[[store.TrackerStore], None]) -> None:
+    """
+    Queue up work on the tracker database for the tracker writer, if the
+    database is being kept.
+    """
+    global _tracker_store
+    if options.TrackerDatabase.CurrentValue != "On":
+        return
+
+    if not _tracker_store:
+        _tracker_store = store.TrackerStore(
+            os.path.join(seeds_dir, store.STORE_NAME)
+        )
+    tracker_store = _tracker_store
+    run_on_writer(lambda: work(tracker_store))
+
+
+def close_tracker_store() -> None:
+    global _tracker_store
+    if _tracker_store:
+        run_on_writer(_tracker_store.close)
+        _tracker_store = None
+
+
+_seed_index: Optional[seedindex.SeedIndex] = None
+
+
+def _get_seed_index() -> seedindex.SeedIndex:
+    """
+    The seeds directory index, which is only to be used on the tracker writer,
+    so that its updates and compactions happen in turn.
+    """
+    global _seed_index
+    if not _seed_index:
+        _seed_index = seedindex.SeedIndex(seeds_dir)
+    return _seed_index
+
+
+def _index_seed(seed: str, **fields: Any) -> None:
+    """Queue up an update to a seed's record in the seeds directory index."""
+    seed_index = _get_seed_index()
+    run_on_writer(lambda: seed_index.update(seed, **fields))
+
+
+def profile_directory() -> str:
+    """The name of the player's profile directory."""
+    return os.path.basename(
+        get_pc().OnlineSub.PlayerInterface.ObjectPointer.ProfileDataDirectory
+    )
+
+
+def seed_metadata(tags: Tag) -> Dict[str, List[str]]:
+    """The options a seed's tags turn on, and the DLCs they require."""
+    return {
+        "options": [
+            tag.caption
+            for tag in TagList
+            if tag in tags
+            and not (tag & ContentTags)
+            and getattr(tag, "caption", None)
+        ],
+        "dlcs": [
+            tag.content_title
+            for tag in TagList
+            if tag in tags and getattr(tag, "dlc_path", None)
+        ],
+    }
+
+
+def _tracker_name(line: str) -> str:
+    return line.rstrip("\n").split(" - ", 1)[0]
+
+
+def _tracker_logs(name: str, item: ItemPool) -> Tuple[str, str, str]:
+    return f"{name}\n", f"{name} - {item.hint}\n", f"{name} - {item.name}\n"
+
+
+def _logged_value(item: ItemPool, logged: int) -> str:
+    return ("", f"{item.hint}", item.name)[logged]
 
 
 class Seed:
@@ -67,12 +281,33 @@ class Seed:
     version: int
     tags: Tag
 
-    version_module: ModuleType
+    version_table: Union[VersionTable, SeedVersion]
+    _tracker: Optional[Tracker] = None
+    # The line of each location in the tracker and how much of it is logged,
+    # by tracker name, along with the tracker lines this was built from.
+    _tracker_index: Dict[str, Tuple[int, int]]
+    _tracker_index_lines: Optional[List[str]] = None
+    # The tracker name on each indexed line, and the item of each location.
+    _tracker_names: Dict[int, str]
+    _tracker_items: Dict[str, ItemPool]
+    # How many of the seed's locations have their items logged.
+    _tracker_found: int = 0
+    # When the tracker was last checked for changes made to its file.
+    _tracker_synced: float = 0.0
+    _rich_tracker: Optional[richtracker.RichTracker] = None
+    # Whether the seed's metadata has been recorded in the seeds index.
+    _metadata_indexed: bool = False
+    # Drops to log in the tracker once the seed is done applying, as it only
+    # has a tracker from then on.
+    _pending_updates: Optional[List[Tuple[Location, bool]]] = None
 
     locations: Sequence[Location]
     items: Sequence[ItemPool]
     item_count: int
 
+    # The seed's locations by content, in the catalog's order.
+    content_locations: Dict[Tag, Sequence[Location]]
+
     def __init__(
         self, data: bytes, version: int, tags: Tag, string: str
     ) -> None:
@@ -91,34 +326,18 @@ class Seed:
         if not value:
             value = random.getrandbits(30)
 
-        value = (value << 42) | (tags.value << 6) | version
-        data = value.to_bytes(length=9, byteorder="big")
-        return cls(data, version, tags, _stringify(data))
+        data = resolver.encode_seed(value, tags.value, version)
+        return cls(data, version, tags, resolver.stringify(data))
 
     @classmethod
     def FromString(cls, string: str) -> Seed:
-        try:
-            data = b32decode(
-                "".join(char.upper() for char in string if char.isalnum())
-                + "="
-            )
-            assert len(data) == 9
-        except:
-            raise ValueError(
-                "Failed to read seed with invalid format: " + string
-            )
-
-        value = int.from_bytes(bytes=data, byteorder="big")
-        version = (2**6 - 1) & value
-        tags = (2**36 - 1) & (value >> 6)
-
-        return cls(data, version, Tag(tags), _stringify(data))
+        data, version, tags = resolver.decode_seed(string)
+        return cls(data, version, Tag(tags), resolver.stringify(data))
 
     @classmethod
-    def Default(cls) -> Seed:
-        player_save_dir = os.path.basename(
-            get_pc().OnlineSub.PlayerInterface.ObjectPointer.ProfileDataDirectory
-        )
+    def Default(cls, player_save_dir: Optional[str] = None) -> Seed:
+        if player_save_dir is None:
+            player_save_dir = profile_directory()
 
         try:
             player_id = int(player_save_dir)
@@ -128,8 +347,28 @@ class Seed:
         return cls.Generate(Tag(2**36 - 1), value=player_id & (2**30 - 1))
 
     def apply(self) -> None:
-        global AppliedSeed, AppliedTags
+        for _ in self.apply_steps():
+            pass
+
+    def apply_async(
+        self,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        on_failed: Optional[Callable[[Exception], None]] = None,
+        budget: float = _APPLY_BUDGET,
+    ) -> SeedApplication:
+        application = SeedApplication(
+            self,
+            self.apply_steps(),
+            budget,
+            on_progress,
+            on_finished,
+            on_failed,
+        )
+        application.start()
+        return application
 
+    def validate(self) -> None:
         if self.version not in SupportedVersions:
             raise ValueError(
                 f"Seed {self.string} is the incorrect version for this release"
@@ -153,20 +392,187 @@ class Seed:
                 f"Seed {self.string} requires additional DLCs to play:{missing_dlcs}"
             )
 
-        if AppliedSeed:
-            AppliedSeed.unapply()
+    def apply_steps(self) -> Iterator[float]:
+        """
+        Cancel any seed still being applied, and validate this one. Returns an
+        iterator that applies the seed a step at a time, yielding the fraction
+        of the work done after each step.
+        """
+        cancel_application()
+        self.validate()
+        return self._apply_steps()
+
+    def _apply_steps(self) -> Iterator[float]:
+        global AppliedSeed, AppliedTags
+
+        if AppliedSeed and AppliedSeed._tracker:
+            AppliedSeed._tracker.flush()
 
         AppliedSeed = self
         AppliedTags = self.tags
+        self._pending_updates = []
+
+        # An archived tracker is restored by the tracker writer while the rest
+        # of the seed is applied.
+        restored: Optional[Future] = None
+        if not os.path.exists(self.tracker_path):
+            restored = self.restore_tracker()
 
         if not is_client():
             options.mod_instance.SendSeed(self.string)
 
-        self.version_module = importlib.import_module(
-            f".{module_name}.v{self.version}", __package__
+        self.version_table = load_version(self.version)
+        yield 0.0
+
+        # How many steps there are is only known once the seed is resolved.
+        if not self.load_assignment():
+            yield 0.0
+            self.resolve()
+            yield 0.0
+            self.save_assignment()
+        yield 0.0
+
+        changes = self.plan_changes()
+        seed_items = [
+            item for item in set(self.items) if item is not items.DudItem
+        ]
+
+        step_count = (
+            len(seed_items) + len(changes) * 2 + len(self.locations) + 3
         )
-        version_items: Sequence[SeedEntry] = self.version_module.Items
-        version_locations: Sequence[SeedEntry] = self.version_module.Locations
+        step = 0
+
+        for item in seed_items:
+            item.apply(self.tags)
+            step += 1
+            yield step / step_count
+
+        for location in changes:
+            if location in _enabled_locations:
+                location.disable()
+                del _enabled_locations[location]
+            location.item = changes[location][0]
+            step += 1
+            yield step / step_count
+
+        # Every hint is reset, including those dismissed for locations whose
+        # assignment is unchanged. Digistruct enemies only know their fallback
+        # once enabled, so check the assigned item rather than the location's.
+        for location, item in zip(self.locations, self.items):
+            if item:
+                location.update_hint()
+                location.toggle_hint(True)
+            step += 1
+            yield step / step_count
+
+        for location in changes:
+            location.enable()
+            _enabled_locations[location] = changes[location]
+            step += 1
+            yield step / step_count
+
+        missions.reset_playthrough()
+        step += 1
+        yield step / step_count
+
+        self.group_locations()
+        step += 1
+        yield step / step_count
+
+        while restored and not restored.done():
+            yield step / step_count
+        if restored and restored.exception():
+            Log(
+                f"Could not restore tracker for {self.string}:"
+                f" {restored.exception()}"
+            )
+
+        self.index_tracker()
+        self.generate_tracker()
+        step += 1
+        yield step / step_count
+
+        pending_updates = self._pending_updates
+        self._pending_updates = None
+        for location, drop in pending_updates:
+            self.update_tracker(location, drop)
+
+    def group_locations(self) -> None:
+        """
+        Group the seed's locations by content. Locations only know their
+        content once enabled.
+        """
+        content_tags = [
+            tag for tag in TagList if tag & ContentTags & self.tags
+        ]
+        content_locations: Dict[Tag, List[Location]] = {
+            tag: [] for tag in content_tags
+        }
+
+        for location in sorted(
+            set(self.locations), key=catalog.location_index
+        ):
+            for tag in content_tags:
+                if tag in location.content:
+                    content_locations[tag].append(location)
+
+        self.content_locations = {
+            tag: locations
+            for tag, locations in content_locations.items()
+            if locations
+        }
+
+    def plan_changes(self) -> Dict[Location, _ActivationKey]:
+        """
+        Returns the locations which need to be (re-)enabled for the seed, in
+        catalog order. Every location is enabled, as those outside of the seed
+        take over their sources of loot so that they drop padding instead of
+        the game's own items.
+        """
+        assignment: Dict[Location, ItemPool] = dict(
+            zip(self.locations, self.items)
+        )
+        seed_order = {
+            location: index for index, location in enumerate(self.locations)
+        }
+        groups = _mission_groups()
+
+        # Missions sharing a mission definition choose between themselves which
+        # one handles it, based on their order in the seed.
+        def activation_key(location: Location) -> _ActivationKey:
+            group = sorted(
+                (
+                    member
+                    for member in groups.get(location, ())
+                    if member in seed_order
+                ),
+                key=seed_order.__getitem__,
+            )
+            return assignment.get(location), tuple(group)
+
+        changes: Dict[Location, _ActivationKey] = dict()
+        for location in Locations:
+            key = activation_key(location)
+            if _enabled_locations.get(location) != key:
+                changes[location] = key
+
+        # Enabling a mission claims its mission definition from the others
+        # sharing it, so those need re-enabling alongside it.
+        pending = list(changes)
+        while pending:
+            for member in groups.get(pending.pop(), ()):
+                if member not in changes:
+                    changes[member] = activation_key(member)
+                    pending.append(member)
+
+        return {
+            location: changes[location]
+            for location in sorted(changes, key=catalog.location_index)
+        }
+
+    def resolve(self) -> None:
+        version_items: Sequence[SeedEntry] = self.version_table.Items
+        version_locations: Sequence[SeedEntry] = self.version_table.Locations
 
         self.items = [
             entry.match_item()
@@ -179,99 +585,425 @@ class Seed:
             if entry.tags in self.tags
         )
 
-        for item in self.items:
-            item.apply(self.tags)
+        self.item_count = len(self.items)
+        self.items = resolver.shuffle_items(
+            self.data,
+            self.items,
+            len(self.locations),
+            bool(self.tags & Tag.DuplicateItems),
+            items.DudItem,
+        )
 
-        location_count = len(self.locations)
-        item_count = self.item_count = len(self.items)
+    @property
+    def assignment_path(self) -> str:
+        return os.path.join(assignments_dir, f"{self.string}.bin")
 
-        randomizer = random.Random(self.data)
+    def load_assignment(self) -> bool:
+        path = self.assignment_path
+        if not os.path.isfile(path):
+            return False
 
-        if location_count < item_count:
-            self.items = randomizer.sample(self.items, location_count)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            (
+                magic,
+                assignment_format,
+                seed_data,
+                digest,
+                table_digest,
+                item_count,
+                count,
+            ) = _assignment_header.unpack_from(data, 0)
+            if (
+                magic != _ASSIGNMENT_MAGIC
+                or assignment_format != _ASSIGNMENT_FORMAT
+                or seed_data != self.data
+                or digest != catalog.digest()
+                or table_digest != version_digest(self.version_table)
+                or len(data)
+                != _assignment_header.size + count * _assignment.size
+            ):
+                return False
 
-        elif location_count == item_count:
-            randomizer.shuffle(self.items)
+            locations: List[Location] = []
+            assigned_items: List[ItemPool] = []
+            for location_index, item_index in _assignment.iter_unpack(
+                data[_assignment_header.size :]
+            ):
+                locations.append(Locations[location_index])
+                assigned_items.append(
+                    items.DudItem
+                    if item_index == _DUD_INDEX
+                    else Items[item_index]
+                )
+        except (OSError, IndexError, struct.error) as error:
+            Log(f"Could not load cached assignment for {self.string}: {error}")
+            return False
 
-        elif self.tags & Tag.DuplicateItems:
-            self.items *= location_count // item_count
-            self.items += randomizer.sample(
-                self.items, location_count % item_count
-            )
-            randomizer.shuffle(self.items)
+        if len(set(locations)) != len(locations):
+            return False
 
-        else:
-            self.items += [items.DudItem] * (location_count - item_count)
-            randomizer.shuffle(self.items)
+        self.locations = tuple(locations)
+        self.items = assigned_items
+        self.item_count = item_count
 
-        for location, item in zip(self.locations, self.items):
-            location.item = item
-            location.update_hint()
-            location.toggle_hint(True)
+        try:
+            os.utime(path)  # Mark it as recently used.
+        except OSError:
+            pass
+        return True
 
-        for location in Locations:
-            location.enable()
+    def save_assignment(self) -> None:
+        path = self.assignment_path
+        try:
+            os.makedirs(assignments_dir, exist_ok=True)
+            with open(path + ".tmp", "wb") as file:
+                file.write(
+                    _assignment_header.pack(
+                        _ASSIGNMENT_MAGIC,
+                        _ASSIGNMENT_FORMAT,
+                        self.data,
+                        catalog.digest(),
+                        version_digest(self.version_table),
+                        self.item_count,
+                        len(self.locations),
+                    )
+                )
+                for location, item in zip(self.locations, self.items):
+                    file.write(
+                        _assignment.pack(
+                            catalog.location_index(location),
+                            (
+                                _DUD_INDEX
+                                if item is items.DudItem
+                                else catalog.item_index(item)
+                            ),
+                        )
+                    )
+            os.replace(path + ".tmp", path)
+        except OSError as error:
+            Log(f"Could not cache assignment for {self.string}: {error}")
+            return
 
-        self.generate_tracker()
+        _prune_assignments()
+
+    def close_tracker(self) -> None:
+        """
+        Write out the seed's tracker and wait for it, as the mod is being
+        disabled.
+        """
+        if self._tracker:
+            self._tracker.close()
 
     def unapply(self) -> None:
         global AppliedSeed, AppliedTags
+        cancel_application()
+
+        if self._tracker:
+            self._tracker.flush()
+
         AppliedSeed = None
         AppliedTags = Tag(0)
+        feed.reset(None, ())
 
-        for location in Locations:
+        for location in _enabled_locations:
             location.item = None
             location.disable()
+        _enabled_locations.clear()
+
+    @property
+    def tracker_path(self) -> str:
+        return os.path.join(seeds_dir, f"{self.string}.txt")
 
-    def generate_tracker(self) -> str:
-        path = os.path.join(seeds_dir, f"{self.string}.txt")
-        if os.path.exists(path):
-            return path
+    @property
+    def tracker(self) -> Tracker:
+        if not self._tracker:
+            self._tracker = Tracker(
+                self.tracker_path, self.tracker_lines, _tracker_name
+            )
+        return self._tracker
+
+    def restore_tracker(self) -> Future:
+        """
+        Queue up restoring the seed's tracker from its archive, if it was
+        archived. Returns a future of whether it was restored, which holds the
+        error instead should restoring it fail.
+        """
+        restored: Future = Future()
+        seed_string = self.string
+        seed_index = _get_seed_index()
+
+        def restore() -> None:
+            try:
+                result = seedindex.restore(seeds_dir, seed_string, seed_index)
+            except Exception as error:
+                restored.set_exception(error)
+            else:
+                restored.set_result(result)
+
+        run_on_writer(restore)
+        return restored
+
+    def tracker_lines(self) -> List[str]:
+        version_tags: Tag = self.version_table.Tags
+
+        item_warning = (
+            " (not all accessible)"
+            if self.item_count > len(self.locations)
+            else ""
+        )
+
+        lines = [
+            f"Loot Randomizer Seed {self.string}\n",
+            "\n",
+            f"Total locations: {len(self.locations)}\n",
+            f"Total items: {self.item_count}{item_warning}\n",
+            "\n",
+        ]
+        for tag in TagList:
+            if tag not in version_tags:
+                continue
+
+            caption = getattr(tag, "caption", None)
+            if caption:
+                lines.append(
+                    f"{tag.caption}: {'On' if (tag in self.tags) else 'Off'}\n"
+                )
+
+        for tag, locations in self.content_locations.items():
+            lines.append("\n")
+            lines.append(f"{tag.content_title}\n")
+
+            for location in locations:
+                lines.append(f"{location}\n")
+
+        return lines
+
+    @property
+    def tracker_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        The line of each of the seed's locations in its tracker, and how much
+        of it is logged, by tracker name.
+        """
+        return self._tracker_index
+
+    def index_tracker(self) -> None:
+        """
+        Index the seed's tracker, and record the whole of it wherever it is
+        kept. Done once the seed is applied, and again should the tracker
+        start over.
+        """
+        lines = self.tracker.lines
+
+        first_indices: Dict[str, int] = dict()
+        for index, line in enumerate(lines):
+            first_indices.setdefault(line, index)
+
+        tracker_index: Dict[str, Tuple[int, int]] = dict()
+        for location, item in zip(self.locations, self.items):
+            name = str(location)
+            entries = [
+                (first_indices[log], logged)
+                for logged, log in enumerate(_tracker_logs(name, item))
+                if log in first_indices
+            ]
+            if entries:
+                tracker_index[name] = min(entries)
+
+        self._tracker_index = tracker_index
+        self._tracker_index_lines = lines
+        self._tracker_names = {
+            index: name for name, (index, _) in tracker_index.items()
+        }
+        self._tracker_items = dict(zip(map(str, self.locations), self.items))
+        self.record_tracker()
+
+    def sync_tracker(self, force: bool = False) -> None:
+        """
+        Bring the seed's tracker up to date with its file, if it was not
+        checked in the last little while (or if forced), indexing it afresh
+        should it have started over, or reindexing any lines edited in it.
+        """
+        now = time.monotonic()
+        if not force and now - self._tracker_synced < TRACKER_SYNC_INTERVAL:
+            return
+        self._tracker_synced = now
+
+        seed_tracker = self.tracker
+        seed_tracker.refresh()
+        edited_lines = seed_tracker.take_edits()
+
+        if self._tracker_index_lines is not seed_tracker.lines:
+            self.index_tracker()
+        elif edited_lines:
+            self.reindex_tracker(edited_lines)
+            self.record_tracker()
+
+    def record_tracker(self) -> None:
+        """
+        Record the whole of the indexed tracker in the tracker database, the
+        overlay feed, the seeds index and the rich tracker.
+        """
+        self._tracker_found = sum(
+            logged == store.LOGGED_FULL
+            for _, logged in self._tracker_index.values()
+        )
+        self.store_tracker()
+        self.publish_tracker()
+        self.index_seed()
+        self.render_rich_tracker()
+
+    def reindex_tracker(self, edited_lines: Iterable[int]) -> None:
+        lines = self.tracker.lines
+        tracker_index = self._tracker_index
+
+        for index in edited_lines:
+            # The line may have been edited to name a different location.
+            name = self._tracker_names.pop(index, None)
+            entry = tracker_index.get(name) if name else None
+            if entry and entry[0] == index:
+                del tracker_index[name]
 
-        version_tags: Tag = self.version_module.Tags
+            line = lines[index]
+            name = _tracker_name(line)
+            item = self._tracker_items.get(name)
+            if not item:
+                continue
 
-        with open(path, "w", encoding="utf-8") as file:
-            item_warning = (
-                " (not all accessible)"
-                if self.item_count > len(self.locations)
-                else ""
+            logs = _tracker_logs(name, item)
+            if line in logs and (
+                name not in tracker_index or tracker_index[name][0] > index
+            ):
+                tracker_index[name] = (index, logs.index(line))
+                self._tracker_names[index] = name
+
+    def store_tracker(self) -> None:
+        """Record the whole of the tracker in the tracker database."""
+        lines = list(self.tracker.lines)
+        tracker_index = self._tracker_index
+        locations = [
+            (name, item.name, *tracker_index[name])
+            for name, item in zip(map(str, self.locations), self.items)
+            if name in tracker_index
+        ]
+        _store_trackers(
+            lambda tracker_store: tracker_store.save_seed(
+                self.string,
+                self.version,
+                self.tags.value,
+                self.item_count,
+                lines,
+                locations,
             )
+        )
 
-            file.write(
-                f"Loot Randomizer Seed {self.string}\n\n"
-                f"Total locations: {len(self.locations)}\n"
-                f"Total items: {self.item_count}{item_warning}\n\n"
+    def index_seed(self) -> None:
+        """
+        Record the seed in the seeds directory index, along with its metadata
+        the first time.
+        """
+        fields: Dict[str, Any] = dict(
+            found=self._tracker_found, last_played=time.time(), archive=None
+        )
+        if not self._metadata_indexed:
+            self._metadata_indexed = True
+            fields.update(
+                game=module_name,
+                version=self.version,
+                tags=self.tags.value,
+                locations=len(self.locations),
+                items=self.item_count,
+                **seed_metadata(self.tags),
             )
-            for tag in TagList:
-                if tag not in version_tags:
-                    continue
+        _index_seed(self.string, **fields)
+
+    def render_rich_tracker(self) -> None:
+        """Render the seed's rich tracker afresh, if one is wanted."""
+        rich_format = options.RichTracker.CurrentValue
+        if (
+            rich_format not in richtracker.FORMATS
+            or self._tracker_index_lines is None
+        ):
+            self._rich_tracker = None
+            return
 
-                caption = getattr(tag, "caption", None)
-                if caption:
-                    file.write(
-                        f"{tag.caption}: {'On' if (tag in self.tags) else 'Off'}\n"
-                    )
+        entries: Dict[Location, richtracker.Entry] = dict()
+        for location, item in zip(self.locations, self.items):
+            name = str(location)
+            if name in self._tracker_index:
+                _, logged = self._tracker_index[name]
+                entries[location] = richtracker.Entry(
+                    name,
+                    len(location.rarities),
+                    logged,
+                    _logged_value(item, logged),
+                )
 
-            for tag in TagList:
-                if not tag & ContentTags & self.tags:
-                    continue
+        self._rich_tracker = richtracker.RichTracker(
+            os.path.join(seeds_dir, self.string),
+            rich_format,
+            f"Loot Randomizer Seed {self.string}",
+            (
+                f"Total locations: {len(self.locations)}",
+                f"Total items: {self.item_count}"
+                + (
+                    " (not all accessible)"
+                    if self.item_count > len(self.locations)
+                    else ""
+                ),
+            ),
+            {
+                tag.content_title: [
+                    entries[location]
+                    for location in locations
+                    if location in entries
+                ]
+                for tag, locations in self.content_locations.items()
+            },
+            [str(hint) for hint in Hint],
+            run_on_writer,
+        )
 
-                locations = tuple(
-                    location
-                    for location in Locations
-                    if tag in location.content and location in self.locations
-                )
-                if not len(locations):
-                    continue
+    def publish_tracker(self) -> None:
+        """Publish the whole of the tracker to the overlay feed."""
+        if not feed.running() or self._tracker_index_lines is None:
+            return
 
-                file.write(f"\n{tag.content_title}\n")
+        locations: List[Tuple[str, int, str]] = []
+        for name, item in zip(map(str, self.locations), self.items):
+            entry = self._tracker_index.get(name)
+            if entry:
+                logged = entry[1]
+                locations.append((name, logged, _logged_value(item, logged)))
+        feed.reset(self.string, locations)
 
-                for location in locations:
-                    file.write(f"{location}\n")
+    def generate_tracker(
+        self, on_generated: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Bring the seed's tracker file up to date, creating it if need be. The
+        given callback is called with its path from the tracker writer once it
+        has been written.
+        """
+        self.sync_tracker(force=True)
+        if on_generated:
+            path = self.tracker_path
+            self.tracker.flush(lambda: on_generated(path))
+        else:
+            self.tracker.flush()
 
-        return path
+    @property
+    def applying(self) -> bool:
+        """Whether the seed is still being applied, and has no tracker yet."""
+        return self._pending_updates is not None
 
     def update_tracker(self, location: Location, drop: bool) -> None:
+        if self._pending_updates is not None:
+            self._pending_updates.append((location, drop))
+            return
+
         if not is_client():
             options.mod_instance.SendTracker(str(location), drop)
 
@@ -283,61 +1015,79 @@ class Seed:
 
         log_item = bool(drop or options.HintDisplay.CurrentValue == "Spoiler")
 
-        none_log = f"{location.tracker_name}\n"
-        hint_log = f"{location.tracker_name} - {location.item.hint}\n"
-        full_log = f"{location.tracker_name} - {location.item.name}\n"
-
-        path = self.generate_tracker()
-
-        try:
-            with open(path, "r", encoding="utf-8") as file:
-                lines = file.readlines()
-        except:
-            with open(path, "r") as file:
-                lines = file.readlines()
+        name = location.tracker_name
+        self.sync_tracker()
+        tracker_index = self.tracker_index
+        entry = tracker_index.get(name)
+        if not entry:
+            return
 
-        for index in range(len(lines)):
-            line = lines[index]
+        index, logged = entry
+        if logged == store.LOGGED_FULL or (
+            logged == store.LOGGED_HINT and not log_item
+        ):
+            return
 
-            if line == none_log:
-                lines[index] = full_log if log_item else hint_log
-                with open(path, "w", encoding="utf-8") as file:
-                    file.writelines(lines)
-                return
+        logged = store.LOGGED_FULL if log_item else store.LOGGED_HINT
+        line = _tracker_logs(name, location.item)[logged]
+        self.tracker.set_line(index, line)
+        tracker_index[name] = (index, logged)
 
-            if line == hint_log:
-                if log_item:
-                    lines[index] = full_log
-                    with open(path, "w", encoding="utf-8") as file:
-                        file.writelines(lines)
-                return
+        if logged == store.LOGGED_FULL:
+            self._tracker_found += 1
+        _index_seed(
+            self.string, found=self._tracker_found, last_played=time.time()
+        )
 
-            if line == full_log:
-                return
+        _store_trackers(
+            lambda tracker_store: tracker_store.log(
+                self.string, ((name, index, line, logged),)
+            )
+        )
+        value = _logged_value(location.item, logged)
+        feed.publish(self.string, name, logged, value)
+        if self._rich_tracker:
+            self._rich_tracker.update(((name, logged, value),))
 
     def populate_tracker(self, spoiler: bool) -> None:
-        path = self.generate_tracker()
-
-        with open(path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
+        logged = store.LOGGED_FULL if spoiler else store.LOGGED_HINT
+        self.sync_tracker(force=True)
+        tracker_index = self.tracker_index
 
+        populated: Dict[int, str] = dict()
+        logs: List[Tuple[str, int, str, int]] = []
+        rich_logs: List[Tuple[str, int, str]] = []
         for location, item in zip(self.locations, self.items):
-            none_log = f"{location}\n"
-            hint_log = f"{location} - {item.hint}\n"
-            full_log = f"{location} - {item.name}\n"
-
-            for index in range(len(lines)):
-                line = lines[index]
-
-                if line == full_log:
-                    break
+            name = str(location)
+            entry = tracker_index.get(name)
+            if not entry or entry[1] >= logged:
+                continue
 
-                if line in (none_log, hint_log):
-                    lines[index] = full_log if spoiler else hint_log
-                    break
+            index = entry[0]
+            populated[index] = _tracker_logs(name, item)[logged]
+            tracker_index[name] = (index, logged)
+            logs.append((name, index, populated[index], logged))
+            if logged == store.LOGGED_FULL:
+                self._tracker_found += 1
+            value = _logged_value(item, logged)
+            feed.publish(self.string, name, logged, value)
+            rich_logs.append((name, logged, value))
+
+        self.tracker.set_lines(
+            [
+                populated.get(index, line)
+                for index, line in enumerate(self.tracker.lines)
+            ]
+        )
 
-        with open(path, "w", encoding="utf-8") as file:
-            file.writelines(lines)
+        _store_trackers(
+            lambda tracker_store: tracker_store.log(self.string, logs)
+        )
+        if self._rich_tracker:
+            self._rich_tracker.update(rich_logs)
+        _index_seed(
+            self.string, found=self._tracker_found, last_played=time.time()
+        )
 
     def populate_hints(self) -> None:
         self.populate_tracker(False)
@@ -346,6 +1096,92 @@ class Seed:
         self.populate_tracker(True)
 
 
+class SeedApplication:
+    """
+    Applies a seed over several ticks, working for at most a given budget of
+    seconds each tick, until it is finished or cancelled.
+    """
+
+    seed: Seed
+    budget: float
+    progress: float = 0.0
+    finished: bool = False
+    cancelled: bool = False
+
+    _steps: Iterator[float]
+    _on_progress: Optional[Callable[[float], None]]
+    _on_finished: Optional[Callable[[], None]]
+    _on_failed: Optional[Callable[[Exception], None]]
+
+    def __init__(
+        self,
+        seed: Seed,
+        steps: Iterator[float],
+        budget: float,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_finished: Optional[Callable[[], None]] = None,
+        on_failed: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.seed = seed
+        self.budget = budget
+        self._steps = steps
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._on_failed = on_failed
+
+    def start(self) -> None:
+        global _application
+        _application = self
+        tick_while(self.tick)
+
+    def cancel(self) -> None:
+        global _application
+        self.cancelled = True
+        if _application is self:
+            _application = None
+
+    def tick(self) -> bool:
+        global _application
+        if self.cancelled:
+            return False
+
+        deadline = time.perf_counter() + self.budget
+        try:
+            while True:
+                self.progress = next(self._steps)
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            self.progress = 1.0
+            self.finished = True
+        except Exception as error:
+            Log(f"Failed to apply seed {self.seed.string}: {error}")
+            self.cancel()
+            if self._on_failed:
+                self._on_failed(error)
+            return False
+
+        if self._on_progress:
+            self._on_progress(self.progress)
+
+        if not self.finished:
+            return True
+
+        if _application is self:
+            _application = None
+        if self._on_finished:
+            self._on_finished()
+        return False
+
+
+_application: Optional[SeedApplication] = None
+
+
+def cancel_application() -> None:
+    if _application:
+        _application.cancel()
+
+
 def generate_wikis(version: int = CurrentVersion) -> None:
     from html import escape
 
@@ -359,8 +1195,9 @@ def generate_wikis(version: int = CurrentVersion) -> None:
 
     dummy = Seed.Generate(dummy_tags, version)
     dummy.apply()
-    version_items: Sequence[SeedEntry] = dummy.version_module.Items
-    version_locations: Sequence[SeedEntry] = dummy.version_module.Locations
+    version_items: Sequence[SeedEntry] = dummy.version_table.Items
+    version_locations: Sequence[SeedEntry] = dummy.version_table.Locations
+    matched_locations = [entry.match_location() for entry in version_locations]
 
     with open(locations_path, "w", encoding="utf-8") as file:
         for content_tag in Tag:
@@ -369,8 +1206,7 @@ def generate_wikis(version: int = CurrentVersion) -> None:
                 continue
 
             locations: List[Location] = []
-            for entry in version_locations:
-                location = entry.match_location()
+            for location in matched_locations:
                 if content_tag & location.content:
                     locations.append(location)
 
@@ -383,8 +1219,6 @@ def generate_wikis(version: int = CurrentVersion) -> None:
             )
 
             for location in locations:
-                location.enable()
-
                 rolls: List[str] = []
                 for rarity in reversed(sorted(location.rarities)):
                     rolls.append(f"<kbd>{rarity}%</kbd>")
@@ -446,7 +1280,7 @@ def generate_wikis(version: int = CurrentVersion) -> None:
 
 
 def generate_seedversion() -> None:
-    path = os.path.join(mod_dir, "Mod", module_name, f"v{CurrentVersion}.py")
+    from . import versiontable
 
     dummy_tags = Tag(0)
     for tag in Tag:
@@ -456,43 +1290,74 @@ def generate_seedversion() -> None:
     dummy = Seed.Generate(dummy_tags, 1)
     dummy.apply()
 
-    with open(path, "w", encoding="utf-8") as file:
-        file.write(
-            "from . import Tag\n"
-            "from ..seed import SeedEntry\n"
-            "\n"
-            "Tags = (\n    "
-        )
+    version_items = [
+        SeedEntry(item.name, item.tags)
+        for item in Items
+        if Tag.Excluded not in item.tags
+    ]
+    version_locations = [
+        SeedEntry(str(location), location.tags)
+        for location in Locations
+        if Tag.Excluded not in location.tags
+    ]
+
+    seed_history = history.load_history(module_name)
+    seed_history.tag_bits = {tag.name: tag.value for tag in Tag}
+    seed_history.record(
+        CurrentVersion,
+        dummy_tags,
+        [(entry.name, int(entry.tags)) for entry in version_items],
+        [(entry.name, int(entry.tags)) for entry in version_locations],
+    )
+    seed_history.save()
+    _seed_versions.pop(CurrentVersion, None)
+
+    versiontable.write(
+        CurrentVersion, dummy_tags, version_items, version_locations
+    )
+
+    # The locations may have changed along with the seed version.
+    _write_rarities()
+
+
+def generate_rarities() -> None:
+    dummy_tags = Tag(0)
+    for tag in Tag:
+        if tag < Tag.Excluded:
+            dummy_tags |= tag
 
-        file.write(
-            "\n    | ".join(
-                f"Tag.{tag.name}" for tag in Tag if tag < Tag.Excluded
-            )
+    dummy = Seed.Generate(dummy_tags)
+    dummy.apply()
+    _write_rarities()
+
+
+def _write_rarities() -> None:
+    """Export the rarities of every location, which must all be enabled."""
+    from . import rarities
+
+    path = rarities.write(
+        module_name,
+        {
+            str(location): location.rarities
+            for location in Locations
+            if Tag.Excluded not in location.tags
+        },
+    )
+    Log(f"Wrote location rarities to {path}")
+
+
+def compile_seedversions() -> None:
+    from . import versiontable
+
+    for version in SupportedVersions:
+        seed_version = load_history_version(version)
+        path = versiontable.write(
+            version,
+            seed_version.Tags,
+            seed_version.Items,
+            seed_version.Locations,
         )
-
-        file.write(f"\n)\n\n# fmt: off\n\n")
-        file.write(f"Items = (\n")
-
-        for item in Items:
-            if Tag.Excluded in item.tags:
-                continue
-            tag_string = "|".join(
-                f"Tag.{tag.name}" for tag in Tag if (tag & item.tags)
-            )
-            file.write(f'    SeedEntry("{item.name}", {tag_string}),\n')
-
-        file.write(f")\n\n\n")
-        file.write(f"Locations = (\n")
-
-        for location in Locations:
-            if Tag.Excluded in location.tags:
-                continue
-            tag_string = "|".join(
-                f"Tag.{tag.name}" for tag in Tag if tag in location.tags
-            )
-            file.write(f'    SeedEntry("{location}", {tag_string}),\n')
-
-        file.write(f")\n")
+        Log(f"Compiled seed version table {path}")
 
 
 """
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse, csv, io, json, multiprocessing, os, random, sys
+
+from typing import Iterator, List, Optional, Sequence, TextIO
+
+# Generates seeds in bulk outside of the game, along with their assignments:
+#
+#   python seedgen.py bl2 --tags "BaseGame|UniqueEnemy" --count 1000
+#
+# Seed values are drawn in the main process from a random generator with a
+# fixed seed, and resolved in order across a pool of worker processes, so the
+# output only depends on the arguments, never on the number of workers.
+
+if __package__:
+    from . import history, resolver
+else:
+    import history, resolver
+
+
+def parse_tags(game: str, names: str) -> int:
+    tag_bits = history.load_history(game).tag_bits
+    tags = 0
+    for name in names.replace(",", "|").split("|"):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in tag_bits:
+            raise ValueError(f"Unknown {game} tag '{name}'")
+        if tag_bits[name] >= 2**36:
+            raise ValueError(f"The {name} tag cannot be part of a seed")
+        tags |= tag_bits[name]
+    return tags
+
+
+def generate_values(count: int, seed: int) -> Iterator[int]:
+    """
+    Yield distinct non-zero seed values, in the same order for the same seed.
+    A value of zero would stand for a random value in Seed.Generate.
+    """
+    randomizer = random.Random(seed)
+    seen = set()
+    while len(seen) < count:
+        value = randomizer.getrandbits(30)
+        if value and value not in seen:
+            seen.add(value)
+            yield value
+
+
+_game: str
+_tags: int
+_version: int
+_format: str
+
+
+def _initialize(
+    game: str, tags: int, version: int, output_format: str
+) -> None:
+    global _game, _tags, _version, _format
+    _game, _tags, _version, _format = game, tags, version, output_format
+    history.load(game, version)
+
+
+def format_resolution(
+    resolution: resolver.Resolution, output_format: str
+) -> str:
+    tag_names = history.load_history(resolution.game).encode_tags(
+        resolution.tags
+    )
+
+    if output_format == "jsonl":
+        return (
+            json.dumps(
+                {
+                    "seed": resolution.string,
+                    "tags": tag_names,
+                    "version": resolution.version,
+                    "item_count": resolution.item_count,
+                    "assignment": dict(resolution.assignment),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+
+    rows = io.StringIO()
+    writer = csv.writer(rows, lineterminator="\n")
+    for location, item in resolution.assignment:
+        writer.writerow((resolution.string, tag_names, location, item))
+    return rows.getvalue()
+
+
+def _generate(value: int) -> str:
+    data = resolver.encode_seed(value, _tags, _version)
+    return format_resolution(resolver.resolve(data, _game, _version), _format)
+
+
+def generate(
+    game: str,
+    tags: int,
+    version: int,
+    values: Sequence[int],
+    output: TextIO,
+    output_format: str = "jsonl",
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> None:
+    if output_format == "csv":
+        output.write("seed,tags,location,item\n")
+
+    arguments = (game, tags, version, output_format)
+    if workers == 1:
+        _initialize(*arguments)
+        for value in values:
+            output.write(_generate(value))
+        return
+
+    with multiprocessing.Pool(workers, _initialize, arguments) as pool:
+        for rows in pool.imap(_generate, values, chunksize):
+            output.write(rows)
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate Loot Randomizer seeds and their assignments."
+    )
+    parser.add_argument("game", choices=("bl2", "tps"))
+    parser.add_argument(
+        "--tags",
+        required=True,
+        help='tag names separated by "|" or ",", e.g. "BaseGame|UniqueEnemy"',
+    )
+    parser.add_argument(
+        "--version",
+        type=int,
+        help="seed version (defaults to the latest in the history)",
+    )
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for drawing seed values; the same seed draws the same values",
+    )
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--output", help="output file (defaults to stdout)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (defaults to the CPU count)",
+    )
+    parser.add_argument("--chunksize", type=int, default=64)
+    args = parser.parse_args(arguments)
+
+    try:
+        tags = parse_tags(args.game, args.tags)
+    except ValueError as error:
+        parser.error(str(error))
+
+    version = args.version
+    if version is None:
+        version = max(history.load_history(args.game).versions)
+
+    values = list(generate_values(args.count, args.seed))
+
+    output = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else sys.stdout
+    )
+    try:
+        generate(
+            args.game,
+            tags,
+            version,
+            values,
+            output,
+            args.format,
+            args.workers,
+            args.chunksize,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
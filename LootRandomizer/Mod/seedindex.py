@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import argparse, json, os, time, zipfile
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# The seeds directory keeps an index of the seeds played in it, so that their
+# details need not be worked out from their trackers. Each record holds a
+# seed's game, version and tags, its location and item counts, the options and
+# DLCs its tags stand for, how many of its locations have been found, and when
+# it was last played.
+#
+# The index is a JSON lines file, appended to with a seed's whole record each
+# time it changes; later records supersede earlier ones for the same seed. It
+# is rewritten with one record per seed once superseded records pile up.
+#
+# Trackers of seeds not played in a while can be bundled into an archive:
+#
+#   python seedindex.py archive --older-than 30
+#   python seedindex.py restore aaaaa-faiac-aaary
+#
+# Like the history module, this only relies on the standard library.
+
+INDEX_NAME = "Seed Index.jsonl"
+ARCHIVE_DIR_NAME = "Archive"
+
+# Superseded records allowed in the index, beyond one per seed, before it is
+# rewritten.
+_COMPACT_SLACK = 256
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return result.st_mtime_ns, result.st_size
+
+
+def default_seeds_dir() -> str:
+    mod_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(mod_dir, "Seeds")
+
+
+class SeedIndex:
+    path: str
+    records: Dict[str, Dict[str, Any]]
+    _line_count: int = 0
+    # The index file's size and modification time as of when it was last
+    # read or written, so that changes made by others are read in.
+    _stat: Optional[Tuple[int, int]] = None
+
+    def __init__(self, seeds_dir: str) -> None:
+        self.path = os.path.join(seeds_dir, INDEX_NAME)
+        self.records = dict()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the record of each seed in the index, reading the index if it
+        has changed since it was last read or written.
+        """
+        stat = _stat(self.path)
+        if stat == self._stat:
+            return self.records
+
+        self.records = dict()
+        self._line_count = 0
+        self._stat = stat
+        if stat is None:
+            return self.records
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # The last record may have been cut off.
+                self.records[record["seed"]] = record
+                self._line_count += 1
+
+        return self.records
+
+    def update(self, seed: str, **fields: Any) -> None:
+        """Update fields of a seed's record, appending it to the index."""
+        record = self.load().setdefault(seed, {"seed": seed})
+        record.update(fields)
+
+        if self._line_count >= len(self.records) + _COMPACT_SLACK:
+            self.compact()
+            return
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._line_count += 1
+        self._stat = _stat(self.path)
+
+    def compact(self) -> None:
+        """Rewrite the index with only the latest record of each seed."""
+        records = self.load()
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps(record, ensure_ascii=False) + "\n"
+                for record in records.values()
+            )
+        os.replace(temporary_path, self.path)
+        self._line_count = len(records)
+        self._stat = _stat(self.path)
+
+
+# The files kept for each seed: its tracker, the tracker's journal, and its
+# rich tracker in either format.
+_SEED_FILE_EXTENSIONS = (".txt", ".journal", ".html", ".md")
+
+
+def _seed_files(seeds_dir: str, seed: str) -> List[str]:
+    return [
+        path
+        for path in (
+            os.path.join(seeds_dir, seed + extension)
+            for extension in _SEED_FILE_EXTENSIONS
+        )
+        if os.path.isfile(path)
+    ]
+
+
+def archive(
+    seeds_dir: str,
+    older_than: float,
+    now: Optional[float] = None,
+    index: Optional[SeedIndex] = None,
+) -> Optional[str]:
+    """
+    Move the trackers of the seeds last played more than the given number of
+    days ago into a zip archive, and return its path. Their cached assignments
+    are removed, as they can be resolved again. Trackers already in the
+    archive are left where they are, rather than replaced.
+
+    Within the mod, this should run on the tracker writer with its index.
+    """
+    if index is None:
+        index = SeedIndex(seeds_dir)
+    cutoff = (time.time() if now is None else now) - older_than * 86400
+
+    seeds = [
+        seed
+        for seed, record in index.load().items()
+        if not record.get("archive")
+        and record.get("last_played", 0) < cutoff
+        and _seed_files(seeds_dir, seed)
+    ]
+    if not seeds:
+        return None
+
+    archive_dir = os.path.join(seeds_dir, ARCHIVE_DIR_NAME)
+    os.makedirs(archive_dir, exist_ok=True)
+    archive_name = time.strftime("Trackers %Y-%m-%d.zip")
+    archive_path = os.path.join(archive_dir, archive_name)
+
+    with zipfile.ZipFile(archive_path, "a", zipfile.ZIP_DEFLATED) as bundle:
+        archived = set(bundle.namelist())
+        # A seed archived earlier the same day and since restored is left out.
+        seeds = [
+            seed
+            for seed in seeds
+            if not any(
+                os.path.basename(path) in archived
+                for path in _seed_files(seeds_dir, seed)
+            )
+        ]
+        for seed in seeds:
+            for path in _seed_files(seeds_dir, seed):
+                bundle.write(path, os.path.basename(path))
+
+    if not seeds:
+        return None
+
+    for seed in seeds:
+        for path in _seed_files(seeds_dir, seed):
+            os.remove(path)
+        cached_path = os.path.join(seeds_dir, "Cache", f"{seed}.bin")
+        if os.path.isfile(cached_path):
+            os.remove(cached_path)
+        index.update(seed, archive=archive_name)
+
+    return archive_path
+
+
+def restore(
+    seeds_dir: str, seed: str, index: Optional[SeedIndex] = None
+) -> bool:
+    """
+    Move a seed's tracker back out of its archive, keeping any of its files
+    already in the seeds directory.
+
+    Within the mod, this should run on the tracker writer with its index.
+    """
+    if index is None:
+        index = SeedIndex(seeds_dir)
+    record = index.load().get(seed)
+    if not record or not record.get("archive"):
+        return False
+
+    archive_path = os.path.join(seeds_dir, ARCHIVE_DIR_NAME, record["archive"])
+    with zipfile.ZipFile(archive_path) as bundle:
+        for name in (seed + extension for extension in _SEED_FILE_EXTENSIONS):
+            if name in bundle.namelist() and not os.path.exists(
+                os.path.join(seeds_dir, name)
+            ):
+                bundle.extract(name, seeds_dir)
+
+    index.update(seed, archive=None)
+    return True
+
+
+def describe(record: Dict[str, Any]) -> str:
+    """Describe what a seed holds, as far as its record tells."""
+    description = f"Seed version {record.get('version')}"
+    if "locations" in record and "items" in record:
+        description += (
+            f", with {record['locations']} locations"
+            f" and {record['items']} items"
+        )
+    description += "."
+
+    dlcs = record.get("dlcs")
+    if dlcs is not None:
+        description += (
+            f" Requires {', '.join(dlcs)}." if dlcs else " Requires no DLC."
+        )
+    if record.get("options"):
+        description += f" Options: {', '.join(record['options'])}."
+    return description
+
+
+def _format_record(record: Dict[str, Any]) -> str:
+    played = time.strftime(
+        "%Y-%m-%d", time.localtime(record.get("last_played", 0))
+    )
+    status = (
+        f" (archived in {record['archive']})" if record.get("archive") else ""
+    )
+    return (
+        f"{record['seed']}  {record.get('game', '?')} v{record.get('version')}"
+        f"  {record.get('found', 0)}/{record.get('locations', '?')} found"
+        f"  last played {played}{status}"
+    )
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Manage the Loot Randomizer seeds directory."
+    )
+    parser.add_argument(
+        "--seeds-dir",
+        default=default_seeds_dir(),
+        help="path to the seeds directory (defaults to the mod's)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser(
+        "list", help="list the seeds in the index"
+    )
+    list_parser.add_argument(
+        "--requires",
+        metavar="DLC",
+        help="only list seeds requiring a DLC whose title contains this",
+    )
+    commands.add_parser("compact", help="rewrite the index compactly")
+
+    archive_parser = commands.add_parser(
+        "archive", help="archive the trackers of seeds not played in a while"
+    )
+    archive_parser.add_argument(
+        "--older-than",
+        type=float,
+        default=30,
+        help="archive seeds last played this many days ago (default 30)",
+    )
+
+    restore_parser = commands.add_parser(
+        "restore", help="move a seed's tracker back out of its archive"
+    )
+    restore_parser.add_argument("seed")
+
+    args = parser.parse_args(arguments)
+
+    if not os.path.isdir(args.seeds_dir):
+        parser.error(f"No seeds directory at {args.seeds_dir}")
+
+    if args.command == "list":
+        requires = args.requires and args.requires.lower()
+        for record in SeedIndex(args.seeds_dir).load().values():
+            if requires and not any(
+                requires in dlc.lower() for dlc in record.get("dlcs", ())
+            ):
+                continue
+            print(_format_record(record))
+            print(f"  {describe(record)}")
+
+    elif args.command == "compact":
+        SeedIndex(args.seeds_dir).compact()
+
+    elif args.command == "archive":
+        archive_path = archive(args.seeds_dir, args.older_than)
+        print(archive_path or "No trackers to archive.")
+
+    elif not restore(args.seeds_dir, args.seed):
+        parser.error(f"Seed {args.seed} is not archived")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from unrealsdk import Log
+
+import os
+
+from typing import List, Optional, Sequence, Set, Tuple
+
+from . import resolver
+
+# The seeds listed in the seed list file are kept in memory, and the file is
+# only read again when its size or modification time have changed, e.g. when
+# players paste seeds into it themselves. Seeds are listed in the order they
+# appear in the file, in their normal form, and only once each.
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return result.st_mtime_ns, result.st_size
+
+
+class SeedList:
+    path: str
+    seeds: List[str]
+
+    _seen: Set[str]
+    # The list file's size and modification time as of when it was last read
+    # or written, and whether it ends partway through a line.
+    _stat: Optional[Tuple[int, int]] = None
+    _unterminated: bool = False
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.seeds = []
+        self._seen = set()
+
+    def load(self) -> Sequence[str]:
+        """
+        Returns the seeds in the list file, reading it if it has changed since
+        it was last read or written. The file is created if need be.
+        """
+        stat = _stat(self.path)
+        if stat is not None and stat == self._stat:
+            return self.seeds
+
+        self.seeds = []
+        self._seen = set()
+        self._stat = None
+        self._unterminated = False
+
+        seeds_dir = os.path.dirname(self.path)
+        if not os.path.exists(seeds_dir):
+            os.mkdir(seeds_dir)
+        elif not os.path.isdir(seeds_dir):
+            Log(f"Could not open seeds directory at {seeds_dir}")
+            return self.seeds
+
+        if os.path.exists(self.path):
+            if not os.path.isfile(self.path):
+                Log(f"Could not open seeds file at {self.path}")
+                return self.seeds
+        else:
+            with open(self.path, "w"):
+                pass
+
+        with open(self.path) as file:
+            contents = file.read()
+        self._stat = _stat(self.path)
+        self._unterminated = contents[-1:] not in ("", "\n", "\r")
+
+        for line in contents.splitlines():
+            line = line.strip()
+            if line == "":
+                continue
+
+            try:
+                data, _, _ = resolver.decode_seed(line)
+            except ValueError as error:
+                Log(error)
+                continue
+
+            seed_string = resolver.stringify(data)
+            if seed_string not in self._seen:
+                self._seen.add(seed_string)
+                self.seeds.append(seed_string)
+
+        return self.seeds
+
+    def __contains__(self, seed_string: str) -> bool:
+        self.load()
+        return seed_string in self._seen
+
+    def add(self, seed_string: str) -> None:
+        """Append a seed to the list file, unless it is already listed."""
+        if seed_string in self:
+            return
+
+        with open(self.path, "a") as file:
+            if self._unterminated:
+                file.write("\n")
+            file.write(seed_string + "\n")
+
+        self._seen.add(seed_string)
+        self.seeds.append(seed_string)
+        self._unterminated = False
+        self._stat = _stat(self.path)
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse, multiprocessing, os
+
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Searches the seed values for a set of tags for seeds that place items where
+# they are wanted, outside of the game:
+#
+#   python seedsearch.py bl2 --tags "BaseGame|UniqueEnemy|Freebie" \
+#       --item "Conference Call" --location-tags Freebie \
+#       --item "Bee" --at "Enemy: " --min-rarity 33
+#
+# Each --item starts a new constraint, and the options following it narrow the
+# locations that item may land on. A seed matches when every constraint holds.
+# The value space is split into blocks evaluated across a pool of worker
+# processes; matches are written in order of value as they are found, and the
+# search stops once enough have been found.
+
+if __package__:
+    from . import history, rarities, resolver
+else:
+    import history, rarities, resolver
+
+
+SEED_VALUES = 2**30
+
+
+class Constraint(NamedTuple):
+    item: str
+    at: Optional[str] = None
+    location_tags: int = 0
+    min_rarity: Optional[int] = None
+
+
+class _ConstraintAction(argparse.Action):
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        constraints: List[dict] = getattr(namespace, "constraints", None) or []
+        if self.dest == "item":
+            constraints.append({"item": values})
+        elif not constraints:
+            parser.error(f"{option_string} must follow an --item")
+        else:
+            constraints[-1][self.dest] = values
+        namespace.constraints = constraints
+
+
+# The state of each worker process: the seed's tags and version, its items and
+# locations, and for each constraint, the location indices it accepts.
+_tags: int
+_version: int
+_items: List[str]
+_location_count: int
+_duplicate_items: bool
+_accepted: List[Tuple[str, Sequence[bool]]]
+
+
+def _initialize(
+    game: str, tags: int, version: int, constraints: Sequence[Constraint]
+) -> None:
+    global _tags, _version, _items, _location_count
+    global _duplicate_items, _accepted
+
+    seed_history = history.load_history(game)
+    seed_version = seed_history.load(version)
+    location_rarities = rarities.load(game)
+
+    _tags = tags
+    _version = version
+    _items = [
+        name for name, item_tags in seed_version.items if item_tags & tags
+    ]
+    locations = [
+        (name, location_tags)
+        for name, location_tags in seed_version.locations
+        if location_tags & tags == location_tags
+    ]
+    _location_count = len(locations)
+    _duplicate_items = bool(tags & seed_history.tag_bits["DuplicateItems"])
+
+    _accepted = []
+    for constraint in constraints:
+        accepted = []
+        for name, location_tags in locations:
+            rolls = location_rarities.get(name, ())
+            accepted.append(
+                (constraint.at is None or constraint.at in name)
+                and location_tags & constraint.location_tags
+                == constraint.location_tags
+                and (
+                    constraint.min_rarity is None
+                    or max(rolls, default=0) >= constraint.min_rarity
+                )
+            )
+        _accepted.append((constraint.item, accepted))
+
+
+def _matches(value: int) -> Optional[str]:
+    data = resolver.encode_seed(value, _tags, _version)
+    shuffled = resolver.shuffle_items(
+        data, _items, _location_count, _duplicate_items, resolver.DUD_ITEM
+    )
+    for item, accepted in _accepted:
+        for index, placed in enumerate(shuffled):
+            if placed == item and accepted[index]:
+                break
+        else:
+            return None
+    return resolver.stringify(data)
+
+
+def _search_block(block: Tuple[int, int]) -> List[str]:
+    matches = []
+    for value in range(*block):
+        string = _matches(value)
+        if string:
+            matches.append(string)
+    return matches
+
+
+def blocks(
+    start: int, stop: int, block_size: int
+) -> Iterator[Tuple[int, int]]:
+    for block_start in range(start, stop, block_size):
+        yield block_start, min(block_start + block_size, stop)
+
+
+def search(
+    game: str,
+    tags: int,
+    version: int,
+    constraints: Sequence[Constraint],
+    start: int = 1,
+    stop: int = SEED_VALUES,
+    limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    block_size: int = 4096,
+) -> Iterator[str]:
+    """
+    Yield the strings of the seeds with values between start and stop whose
+    assignments satisfy every constraint, in order of value. Raises ValueError
+    up front if no seed with the given tags could satisfy a constraint.
+    """
+    # A value of zero would stand for a random value in Seed.Generate.
+    start = max(start, 1)
+    if limit is not None and limit <= 0:
+        return
+
+    arguments = (game, tags, version, constraints)
+    found = 0
+
+    # No seed can satisfy a constraint on an item the tags leave out, or one
+    # that accepts none of the locations the tags leave in.
+    _initialize(*arguments)
+    seed_items = set(_items)
+    for item, accepted in _accepted:
+        if item not in seed_items:
+            raise ValueError(f"No item '{item}' in seeds with these tags")
+        if not any(accepted):
+            raise ValueError(
+                f"No location in seeds with these tags accepts '{item}'"
+            )
+
+    if workers == 1:
+        results: Iterator[List[str]] = map(
+            _search_block, blocks(start, stop, block_size)
+        )
+        for matches in results:
+            for string in matches:
+                yield string
+                found += 1
+                if found == limit:
+                    return
+        return
+
+    with multiprocessing.Pool(workers, _initialize, arguments) as pool:
+        for matches in pool.imap(
+            _search_block, blocks(start, stop, block_size)
+        ):
+            for string in matches:
+                yield string
+                found += 1
+                if found == limit:
+                    return
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Search for Loot Randomizer seeds placing items as wanted."
+    )
+    parser.add_argument("game", choices=("bl2", "tps"))
+    parser.add_argument(
+        "--tags",
+        required=True,
+        help='tag names separated by "|" or ",", e.g. "BaseGame|UniqueEnemy"',
+    )
+    parser.add_argument(
+        "--version",
+        type=int,
+        help="seed version (defaults to the latest in the history)",
+    )
+    parser.add_argument(
+        "--item",
+        action=_ConstraintAction,
+        help="start a constraint that this item lands on an accepted location",
+    )
+    parser.add_argument(
+        "--at",
+        action=_ConstraintAction,
+        help="accept only locations whose name contains this text",
+    )
+    parser.add_argument(
+        "--location-tags",
+        action=_ConstraintAction,
+        help="accept only locations with all of these tags",
+    )
+    parser.add_argument(
+        "--min-rarity",
+        type=int,
+        action=_ConstraintAction,
+        help="accept only locations with a roll of at least this rarity",
+    )
+    parser.add_argument("--start", type=int, default=1)
+    parser.add_argument("--stop", type=int, default=SEED_VALUES)
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=1,
+        help="stop after this many matches (0 for no limit)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (defaults to the CPU count)",
+    )
+    parser.add_argument("--block-size", type=int, default=4096)
+    args = parser.parse_args(arguments)
+
+    if not getattr(args, "constraints", None):
+        parser.error("at least one --item is required")
+
+    if __package__:
+        from .seedgen import parse_tags
+    else:
+        from seedgen import parse_tags
+
+    seed_history = history.load_history(args.game)
+    try:
+        tags = parse_tags(args.game, args.tags)
+        constraints = [
+            Constraint(
+                constraint["item"],
+                constraint.get("at"),
+                parse_tags(args.game, constraint.get("location_tags", "")),
+                constraint.get("min_rarity"),
+            )
+            for constraint in args.constraints
+        ]
+    except ValueError as error:
+        parser.error(str(error))
+
+    version = args.version
+    if version is None:
+        version = max(seed_history.versions)
+
+    seed_items = {name for name, _ in seed_history.load(version).items}
+    for constraint in constraints:
+        if constraint.item not in seed_items:
+            parser.error(
+                f"No item '{constraint.item}' in seed version {version}"
+            )
+
+    if any(constraint.min_rarity is not None for constraint in constraints):
+        if not rarities.load(args.game):
+            parser.error(f"No location rarities exported for {args.game}")
+        # The rarities are exported along with each new seed version, so
+        # they cover every location of the latest one.
+        latest_version = max(seed_history.versions)
+        missing = rarities.missing(
+            args.game,
+            (name for name, _ in seed_history.load(latest_version).locations),
+        )
+        if missing:
+            parser.error(
+                f"The location rarities exported for {args.game} are out of "
+                f"date, missing {len(missing)} locations of seed version "
+                f"{latest_version} such as '{missing[0]}'"
+            )
+
+    try:
+        for string in search(
+            args.game,
+            tags,
+            version,
+            constraints,
+            args.start,
+            args.stop,
+            args.limit or None,
+            args.workers,
+            args.block_size,
+        ):
+            print(string, flush=True)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json, os
+
+from typing import Any, Dict, List, Optional
+
+# What the mod works out from the game each time it enables, such as which DLCs
+# a profile owns, is cached per profile between sessions. Each cache file
+# records what its values were worked out under: the catalog's digest, the
+# current seed version and the DLCs installed in the game's DLC folder. The
+# values are only used while all of these still match.
+
+
+def installed_dlcs(mod_dir: str) -> Optional[List[str]]:
+    """
+    The names of the DLC packages installed in the game's DLC folder. Owning a
+    DLC needs it installed, so a DLC bought since leaves a new package here.
+    """
+    game_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(mod_dir)))
+    )
+    try:
+        return sorted(os.listdir(os.path.join(game_dir, "WillowGame", "DLC")))
+    except OSError:
+        return None
+
+
+class StartupCache:
+    profile: str
+    path: str
+    key: Dict[str, Any]
+    values: Dict[str, Any]
+
+    def __init__(self, cache_dir: str, profile: str, **key: Any) -> None:
+        """
+        Load the cache of the given profile, keeping its values only if they
+        were worked out under the given key.
+        """
+        self.profile = profile
+        self.path = os.path.join(cache_dir, f"Profile {profile}.json")
+        self.key = key
+        self.values = dict()
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(cached, dict) and cached.get("key") == key:
+            self.values = cached.get("values", {})
+
+    def update(self, **values: Any) -> None:
+        """Set values in the cache, and write it out."""
+        self.values.update(values)
+
+        temporary_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump({"key": self.key, "values": self.values}, file)
+            os.replace(temporary_path, self.path)
+        except OSError:
+            pass  # The values are simply worked out again next session.
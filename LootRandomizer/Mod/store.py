@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import argparse, os, sqlite3, sys
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Optionally, every seed's tracker is also recorded in a single database in the
+# seeds directory, holding the tracker's lines along with each location's item
+# and how much of it has been logged. This lets tools query across seeds
+# without reading every tracker file, e.g.:
+#
+#   python store.py found "Conference Call"
+#   python store.py remaining aaaaa-faiac-aaary
+#   python store.py export aaaaa-faiac-aaary --output tracker.txt
+#
+# Like the history module, this only relies on the standard library.
+
+STORE_NAME = "Trackers.sqlite"
+
+# How much of a location has been logged: nothing, its hint, or its item.
+LOGGED_NONE, LOGGED_HINT, LOGGED_FULL = range(3)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seeds (
+    seed TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    tags INTEGER NOT NULL,
+    item_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lines (
+    seed TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    line TEXT NOT NULL,
+    PRIMARY KEY (seed, number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS locations (
+    seed TEXT NOT NULL,
+    location TEXT NOT NULL,
+    item TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    logged INTEGER NOT NULL,
+    PRIMARY KEY (seed, location)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS locations_location ON locations (location);
+CREATE INDEX IF NOT EXISTS locations_item ON locations (item, logged);
+"""
+
+
+def default_path() -> str:
+    mod_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(mod_dir, "Seeds", STORE_NAME)
+
+
+class TrackerStore:
+    path: str
+    _connection: Optional[sqlite3.Connection] = None
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if not self._connection:
+            # The game only uses the store from the tracker writer thread,
+            # though that thread is started anew each time the mod enables.
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def save_seed(
+        self,
+        seed: str,
+        version: int,
+        tags: int,
+        item_count: int,
+        lines: Sequence[str],
+        locations: Iterable[Tuple[str, str, int, int]],
+    ) -> None:
+        """
+        Record the whole of a seed's tracker, replacing what was recorded for
+        it before. Locations are given by name, with the name of their item,
+        their line number and how much of them is logged.
+        """
+        with self.connection as connection:
+            connection.execute("DELETE FROM lines WHERE seed = ?", (seed,))
+            connection.execute("DELETE FROM locations WHERE seed = ?", (seed,))
+            connection.execute(
+                "INSERT OR REPLACE INTO seeds VALUES (?, ?, ?, ?)",
+                (seed, version, tags, item_count),
+            )
+            connection.executemany(
+                "INSERT INTO lines VALUES (?, ?, ?)",
+                ((seed, number, line) for number, line in enumerate(lines)),
+            )
+            connection.executemany(
+                "INSERT INTO locations VALUES (?, ?, ?, ?, ?)",
+                ((seed, *location) for location in locations),
+            )
+
+    def log(
+        self, seed: str, logs: Iterable[Tuple[str, int, str, int]]
+    ) -> None:
+        """
+        Record locations being logged in a seed's tracker, given by name along
+        with their line number, new line and how much of them is now logged.
+        """
+        with self.connection as connection:
+            for location, number, line, logged in logs:
+                connection.execute(
+                    "UPDATE lines SET line = ? WHERE seed = ? AND number = ?",
+                    (line, seed, number),
+                )
+                connection.execute(
+                    "UPDATE locations SET logged = ?"
+                    " WHERE seed = ? AND location = ?",
+                    (logged, seed, location),
+                )
+
+    def export(self, seed: str) -> List[str]:
+        """Returns the lines of a seed's tracker, as in its tracker file."""
+        return [
+            line
+            for line, in self.connection.execute(
+                "SELECT line FROM lines WHERE seed = ? ORDER BY number",
+                (seed,),
+            )
+        ]
+
+    def found(self, item: str) -> List[Tuple[str, str]]:
+        """Returns the seeds and locations in which an item has been found."""
+        return self.connection.execute(
+            "SELECT seed, location FROM locations"
+            " WHERE item = ? AND logged = ? ORDER BY seed, location",
+            (item, LOGGED_FULL),
+        ).fetchall()
+
+    def remaining(self, seed: str) -> int:
+        """Returns how many of a seed's locations have yet to be found."""
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM locations WHERE seed = ? AND logged != ?",
+            (seed, LOGGED_FULL),
+        ).fetchone()
+        return count
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Query the Loot Randomizer tracker database."
+    )
+    parser.add_argument(
+        "--database",
+        default=default_path(),
+        help="path to the database (defaults to the one in Seeds)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    found = commands.add_parser(
+        "found", help="list the seeds and locations an item was found in"
+    )
+    found.add_argument("item")
+
+    remaining = commands.add_parser(
+        "remaining", help="count the locations left to find in a seed"
+    )
+    remaining.add_argument("seed")
+
+    export = commands.add_parser("export", help="export a seed's tracker")
+    export.add_argument("seed")
+    export.add_argument("--output", help="output file (defaults to stdout)")
+
+    args = parser.parse_args(arguments)
+
+    if not os.path.isfile(args.database):
+        parser.error(f"No tracker database at {args.database}")
+
+    tracker_store = TrackerStore(args.database)
+    try:
+        if args.command == "found":
+            for seed, location in tracker_store.found(args.item):
+                print(f"{seed}: {location}")
+
+        elif args.command == "remaining":
+            print(tracker_store.remaining(args.seed))
+
+        else:
+            lines = tracker_store.export(args.seed)
+            if not lines:
+                parser.error(f"No tracker recorded for seed {args.seed}")
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as file:
+                    file.writelines(lines)
+            else:
+                sys.stdout.writelines(lines)
+    finally:
+        tracker_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+from unrealsdk import Log
+
+import difflib, json, os, queue, threading, time
+
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+# A seed's tracker is kept in memory while the seed is applied. Each change to
+# it is appended to a journal next to the tracker file, and the tracker file
+# itself is only rewritten (from memory) every so often, after which the
+# journal is emptied. Should the game exit before the tracker is rewritten, the
+# journal is replayed over the tracker file the next time it is loaded.
+#
+# Journal entries record the line being replaced and its replacement, and are
+# applied to the first line matching the former. Replaying an entry that has
+# already made it into the tracker file therefore does nothing.
+#
+# Writing to the journal and rewriting tracker files is left to a writer
+# thread, so that the game thread only ever queues up work, and only waits on
+# the writer when the mod is disabled. The writer waits a moment after
+# receiving work for more to arrive, and writes everything for each tracker at
+# once, while keeping it in order with other work queued up for it.
+#
+# Players may also edit tracker files themselves. The size and modification
+# time of a tracker file are noted whenever it is read or written, and when
+# they differ, the file is compared with what was last read or written, and the
+# changed lines are merged into the tracker in memory. The writer never
+# overwrites a tracker file with edits yet to be merged.
+
+# Seconds to wait after a change before rewriting the tracker file.
+RENDER_INTERVAL = 30.0
+# Seconds the writer waits for more work before writing what it has.
+COALESCE_WINDOW = 0.25
+# Seconds to wait on the writer when closing a tracker or stopping the writer.
+FLUSH_TIMEOUT = 5.0
+
+_QUEUE_SIZE = 1024
+
+
+def _read_lines(path: str) -> List[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return file.readlines()
+    except UnicodeDecodeError:
+        with open(path, "r") as file:
+            return file.readlines()
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return result.st_mtime_ns, result.st_size
+
+
+def _replace(lines: List[str], old_line: str, new_line: str) -> bool:
+    for index, line in enumerate(lines):
+        if line == old_line:
+            lines[index] = new_line
+            return True
+    return False
+
+
+class Tracker:
+    path: str
+    journal_path: str
+    lines: List[str]
+
+    _generate: Callable[[], List[str]]
+    # What a line is about (e.g. the location it logs), for carrying changes
+    # over to fresh lines that differ from the lines they replaced.
+    _line_key: Optional[Callable[[str], str]]
+    # Changes made since the lines were last copied for the tracker file.
+    _unrendered: List[Tuple[str, str]]
+    _first_unrendered: float = 0.0
+    # Only held to change the lines or copy them, never while writing them.
+    _lock: threading.Lock
+    _render_queued: bool = False
+    # Whether the tracker file has been written (or loaded) yet, and whether
+    # the writer has since found it deleted.
+    _written: bool = False
+    _deleted: bool = False
+    # The tracker file's lines and size and modification time, as of when it
+    # was last read or written, and the lines edited in place since then.
+    _file_lines: Sequence[str] = ()
+    _file_stat: Optional[Tuple[int, int]] = None
+    _edited_lines: Set[int]
+
+    def __init__(
+        self,
+        path: str,
+        generate: Callable[[], List[str]],
+        line_key: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """
+        Load the tracker at the given path, replaying its journal if need be.
+        If there is no tracker file, it is created from the given lines.
+        """
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self._generate = generate
+        self._line_key = line_key
+        self._unrendered = []
+        self._lock = threading.Lock()
+        self._edited_lines = set()
+
+        if os.path.exists(path):
+            self._file_stat = _stat(path)
+            self._file_lines = _read_lines(path)
+            self.lines = list(self._file_lines)
+            self._written = True
+            if self._replay():
+                self._queue_render()
+        else:
+            self.lines = generate()
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._queue_render()
+
+    def _replay(self) -> bool:
+        if not os.path.exists(self.journal_path):
+            return False
+
+        with open(self.journal_path, "r", encoding="utf-8") as file:
+            for entry in file:
+                try:
+                    old_line, new_line = json.loads(entry)
+                except ValueError:
+                    break  # The last entry may have been cut off.
+                _replace(self.lines, old_line, new_line)
+
+        return True
+
+    def _queue_render(self) -> None:
+        if not self._render_queued:
+            self._render_queued = True
+            _writer.put(("render", self))
+
+    def _start_over(self) -> None:
+        """
+        If the tracker file was deleted, start the tracker over from fresh,
+        with only the changes since it was last rewritten carried over.
+        """
+        if not self._deleted:
+            return
+        self._deleted = False
+        self._written = False
+
+        lines = self._generate()
+        with self._lock:
+            for old_line, new_line in self._unrendered:
+                if not _replace(lines, old_line, new_line):
+                    self._carry_over(lines, new_line)
+            self.lines = lines
+        self._queue_render()
+
+    def _carry_over(self, lines: List[str], new_line: str) -> None:
+        # The line a change replaced may itself have been a change written to
+        # the deleted file, so replace the fresh line about the same thing.
+        if not self._line_key:
+            return
+        key = self._line_key(new_line)
+        for index, line in enumerate(lines):
+            if self._line_key(line) == key:
+                lines[index] = new_line
+                return
+
+    def _merge_edits(self) -> None:
+        stat = _stat(self.path)
+        if stat is None or stat == self._file_stat:
+            return
+        edited_lines = _read_lines(self.path)
+
+        with self._lock:
+            # Lines are only ever changed in place in memory, so the lines in
+            # memory line up with the lines last read or written.
+            file_lines = self._file_lines
+            matcher = difflib.SequenceMatcher(
+                None, file_lines, edited_lines, autojunk=False
+            )
+
+            merged: List[str] = []
+            changed: List[int] = []
+            in_place = True
+            for tag, start, end, edit_start, edit_end in matcher.get_opcodes():
+                if tag == "equal":
+                    merged += self.lines[start:end]
+                elif end - start == edit_end - edit_start:
+                    # Lines edited in place keep any change made in memory.
+                    for index, edit_index in zip(
+                        range(start, end), range(edit_start, edit_end)
+                    ):
+                        if self.lines[index] == file_lines[index]:
+                            changed.append(index)
+                            merged.append(edited_lines[edit_index])
+                        else:
+                            merged.append(self.lines[index])
+                else:
+                    in_place = False
+                    merged += edited_lines[edit_start:edit_end]
+
+            if in_place:
+                for index in changed:
+                    self.lines[index] = merged[index]
+                self._edited_lines.update(changed)
+            else:
+                self.lines = merged
+                self._edited_lines.clear()
+
+            self._file_lines = edited_lines
+            self._file_stat = stat
+
+        if self._unrendered:
+            self._queue_render()
+
+    def refresh(self) -> None:
+        """
+        Bring the tracker up to date with its file, starting it over if the
+        file was deleted, or merging in any edits made to it.
+        """
+        self._start_over()
+        if self._written:
+            self._merge_edits()
+
+    def take_edits(self) -> Set[int]:
+        """
+        Returns the lines edited in place since last asked. Should lines have
+        been added or removed, the tracker's lines are replaced altogether.
+        """
+        edited_lines = self._edited_lines
+        self._edited_lines = set()
+        return edited_lines
+
+    def set_line(self, index: int, line: str) -> None:
+        with self._lock:
+            old_line = self.lines[index]
+            if old_line == line:
+                return
+
+            self.lines[index] = line
+            if not self._unrendered:
+                self._first_unrendered = time.monotonic()
+            self._unrendered.append((old_line, line))
+
+        _writer.put(("journal", self, old_line, line))
+
+        if time.monotonic() - self._first_unrendered >= RENDER_INTERVAL:
+            self._queue_render()
+
+    def set_lines(self, lines: Sequence[str]) -> None:
+        """Change every line of the tracker, rewriting it right away."""
+        for index, line in enumerate(lines):
+            self.set_line(index, line)
+        self._queue_render()
+
+    def render(self) -> None:
+        """
+        Rewrite the tracker file from memory, and empty the journal. Only
+        called by the writer.
+        """
+        self._render_queued = False
+
+        with self._lock:
+            if self._written:
+                stat = _stat(self.path)
+                if stat is None:
+                    self._deleted = True
+                    return
+                if stat != self._file_stat:
+                    return  # Edits to the file are to be merged first.
+
+            snapshot = list(self.lines)
+            self._unrendered = []
+
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.writelines(snapshot)
+        os.replace(temporary_path, self.path)
+        stat = _stat(self.path)
+
+        with self._lock:
+            self._file_lines = snapshot
+            self._file_stat = stat
+            self._written = True
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def write_journal(self, entries: Sequence[Tuple[str, str]]) -> None:
+        """Append entries to the journal. Only called by the writer."""
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps(entry, ensure_ascii=False) + "\n"
+                for entry in entries
+            )
+
+    def flush(self, on_flushed: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queue up a rewrite of the tracker file if it has changed (or was
+        deleted). The given callback is called from the writer thread once the
+        tracker file has been written.
+        """
+        self.refresh()
+        if self._unrendered or not os.path.exists(self.path):
+            self._queue_render()
+        if on_flushed:
+            run_on_writer(on_flushed)
+
+    def close(self) -> None:
+        """
+        Rewrite the tracker file if it has changed (or was deleted), and wait
+        for the writer to finish. Only for when the mod is being disabled, as
+        this blocks the game thread.
+        """
+        self.flush()
+        _writer.flush()
+
+        # The writer may have found the file deleted or edited in the meantime.
+        if self._deleted or self._unrendered:
+            self.flush()
+            _writer.flush()
+
+
+class _Writer:
+    _queue: queue.Queue
+    _thread: Optional[threading.Thread] = None
+    _errors: List[str]
+
+    def __init__(self) -> None:
+        self._queue = queue.Queue(_QUEUE_SIZE)
+        self._errors = []
+
+    def put(self, work: Tuple) -> None:
+        while self._errors:
+            Log(f"Failed to write tracker: {self._errors.pop(0)}")
+
+        if not self._thread:
+            self._thread = threading.Thread(
+                target=self._run, name="LootRandomizer.tracker", daemon=True
+            )
+            self._thread.start()
+
+        self._queue.put(work)
+
+    def flush(self) -> None:
+        if not self._thread:
+            return
+        flushed = threading.Event()
+        self.put(("flush", flushed))
+        flushed.wait(FLUSH_TIMEOUT)
+
+    def stop(self) -> None:
+        if not self._thread:
+            return
+        self.flush()
+        self._queue.put(("stop",))
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+
+            deadline = time.monotonic() + COALESCE_WINDOW
+            while batch[-1][0] in ("journal", "render", "call"):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+            for work in batch:
+                if work[0] == "flush":
+                    work[1].set()
+                elif work[0] == "stop":
+                    return
+
+    def _write(self, batch: Sequence[Tuple]) -> None:
+        # Work is done in the order it was queued, with each run of tracker
+        # work between calls written at once. A rewrite of a tracker covers
+        # every change to it queued before, so only the journal entries queued
+        # after its last rewrite in the run are written.
+        renders: Dict[Tracker, bool] = dict()
+        entries: Dict[Tracker, List[Tuple[str, str]]] = dict()
+        for work in batch:
+            if work[0] == "render":
+                renders[work[1]] = True
+                entries.pop(work[1], None)
+            elif work[0] == "journal":
+                entries.setdefault(work[1], []).append((work[2], work[3]))
+            else:
+                self._write_trackers(renders, entries)
+                renders = dict()
+                entries = dict()
+                if work[0] == "call":
+                    try:
+                        work[1]()
+                    except Exception as error:
+                        self._errors.append(str(error))
+
+        self._write_trackers(renders, entries)
+
+    def _write_trackers(
+        self,
+        renders: Dict[Tracker, bool],
+        entries: Dict[Tracker, List[Tuple[str, str]]],
+    ) -> None:
+        for tracker in dict.fromkeys((*renders, *entries)):
+            try:
+                if tracker in renders:
+                    tracker.render()
+                if tracker in entries:
+                    tracker.write_journal(entries[tracker])
+            except Exception as error:
+                self._errors.append(f"{tracker.path}: {error}")
+
+
+_writer = _Writer()
+
+
+def run_on_writer(work: Callable[[], None]) -> None:
+    """Queue up work to be done by the writer thread, in order."""
+    _writer.put(("call", work))
+
+
+def stop() -> None:
+    """Write everything queued up, and stop the writer thread."""
+    _writer.stop()
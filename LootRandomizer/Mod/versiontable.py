@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from unrealsdk import Log
+
+from .defines import *
+from . import catalog
+from .catalog import Items, Locations, module_name
+from .items import ItemPool
+from .locations import Location
+from .seed import SeedEntry
+
+import mmap, os, struct
+
+from typing import Dict, Iterator, Optional, Sequence, Type, overload
+
+# Compiled seed version tables hold the same data as the seed version history,
+# but refer to items and locations by their index in the catalog, and to tags by
+# their plain integer masks. The header records the digest of the catalog the
+# table was compiled against; a table compiled against a different catalog is
+# ignored in favor of the history.
+
+_MAGIC = b"LRSV"
+_FORMAT = 1
+
+# magic, format, seed version, catalog digest, version tags, counts
+_header = struct.Struct("<4sHH16sQHH")
+# catalog index, tag mask
+_record = struct.Struct("<HQ")
+
+
+def table_path(version: int) -> str:
+    return os.path.join(mod_dir, "Mod", module_name, f"v{version}.bin")
+
+
+class ItemRecord(SeedEntry):
+    __slots__ = ("index",)
+
+    index: int
+
+    def __init__(self, index: int, tags: Tag) -> None:
+        self.index = index
+        self.tags = tags
+
+    @property
+    def name(self) -> str:  # type: ignore
+        return Items[self.index].name
+
+    def match_item(self) -> ItemPool:
+        return Items[self.index]
+
+
+class LocationRecord(SeedEntry):
+    __slots__ = ("index",)
+
+    index: int
+
+    def __init__(self, index: int, tags: Tag) -> None:
+        self.index = index
+        self.tags = tags
+
+    @property
+    def name(self) -> str:  # type: ignore
+        return str(Locations[self.index])
+
+    def match_location(self) -> Location:
+        return Locations[self.index]
+
+
+class _Records(Sequence[SeedEntry]):
+    _buffer: mmap.mmap
+    _offset: int
+    _count: int
+    _record_type: Type[SeedEntry]
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        offset: int,
+        count: int,
+        record_type: Type[SeedEntry],
+    ) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._record_type = record_type
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> SeedEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[SeedEntry]: ...
+
+    def __getitem__(self, index):  # type: ignore
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("seed version record index out of range")
+
+        catalog_index, tags = _record.unpack_from(
+            self._buffer, self._offset + index * _record.size
+        )
+        return self._record_type(catalog_index, Tag(tags))
+
+    def __iter__(self) -> Iterator[SeedEntry]:
+        record_type = self._record_type
+        for catalog_index, tags in _record.iter_unpack(
+            self._buffer[
+                self._offset : self._offset + self._count * _record.size
+            ]
+        ):
+            yield record_type(catalog_index, Tag(tags))
+
+
+class VersionTable:
+    version: int
+
+    Tags: Tag
+    Items: Sequence[SeedEntry]
+    Locations: Sequence[SeedEntry]
+
+    _buffer: mmap.mmap
+
+    def __init__(self, version: int, buffer: mmap.mmap) -> None:
+        (
+            magic,
+            table_format,
+            table_version,
+            digest,
+            tags,
+            item_count,
+            location_count,
+        ) = _header.unpack_from(buffer, 0)
+
+        if (
+            magic != _MAGIC
+            or table_format != _FORMAT
+            or table_version != version
+        ):
+            raise ValueError(f"Invalid seed version table for v{version}")
+        if digest != catalog.digest():
+            raise ValueError(f"Outdated seed version table for v{version}")
+
+        item_offset = _header.size
+        location_offset = item_offset + item_count * _record.size
+        if len(buffer) != location_offset + location_count * _record.size:
+            raise ValueError(f"Truncated seed version table for v{version}")
+
+        self.version = version
+        self._buffer = buffer
+
+        self.Tags = Tag(tags)
+        self.Items = _Records(buffer, item_offset, item_count, ItemRecord)
+        self.Locations = _Records(
+            buffer, location_offset, location_count, LocationRecord
+        )
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+_tables: Dict[int, VersionTable] = dict()
+
+
+def load(version: int) -> Optional[VersionTable]:
+    table = _tables.get(version)
+    if table:
+        return table
+
+    path = table_path(version)
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as error:
+        Log(f"Could not map seed version table {path}: {error}")
+        return None
+
+    try:
+        table = VersionTable(version, buffer)
+    except (ValueError, struct.error) as error:
+        buffer.close()
+        Log(error)
+        return None
+
+    _tables[version] = table
+    return table
+
+
+def release(version: int) -> None:
+    table = _tables.pop(version, None)
+    if table:
+        table.close()
+
+
+def write(
+    version: int,
+    tags: Tag,
+    items: Sequence[SeedEntry],
+    locations: Sequence[SeedEntry],
+) -> str:
+    release(version)
+
+    path = table_path(version)
+    with open(path, "wb") as file:
+        file.write(
+            _header.pack(
+                _MAGIC,
+                _FORMAT,
+                version,
+                catalog.digest(),
+                int(tags),
+                len(items),
+                len(locations),
+            )
+        )
+        for entry in items:
+            index = catalog.item_index(entry.match_item())
+            file.write(_record.pack(index, int(entry.tags)))
+        for entry in locations:
+            index = catalog.location_index(entry.match_location())
+            file.write(_record.pack(index, int(entry.tags)))
+
+    return path
@@ -31,8 +31,19 @@ if __name__ == "__main__":
         game_module_name,
         game_module_name + ".items",
         game_module_name + ".locations",
-        *(f"{game_module_name}.v{version}" for version in range(1, 32)),
+        "catalog",
+        "history",
+        "feed",
+        "rarities",
+        "resolver",
+        "richtracker",
+        "seedindex",
+        "seedlist",
+        "startupcache",
+        "store",
+        "tracker",
         "seed",
+        "versiontable",
     )
 
     import sys, importlib
@@ -93,7 +104,7 @@ class LootRandomizer(ModMenu.SDKMod):
         host_seed = seed.Seed.FromString(seed_string)
         host_seed.apply()
         options.HideSeedOptions()
-        options.SaveSeedString(seed_string)
+        options.SeedLibrary.add(host_seed.string)
 
     @ModMenu.ClientMethod
     def SendTracker(self, entry: str, drop: bool) -> None: